@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+
+"""Load test a pooled, read-only manager with increasing numbers of threads.
+
+Run with ``python benchmarks/concurrent_reads.py --connection postgresql://...`` against a populated database. Without
+a connection, a temporary SQLite database is populated from the test files.
+"""
+
+import os
+import random
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import click
+
+from bio2bel_sider import Manager
+from bio2bel_sider.models import Compound
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+TESTS = os.path.join(HERE, os.pardir, 'tests')
+
+
+def _run(manager: Manager, stitch_ids, requests: int) -> None:
+    for _ in range(requests):
+        try:
+            compound = manager.get_compound_by_stitch_id(random.choice(stitch_ids))
+            compound.side_effects.count()
+        finally:
+            manager.session.remove()
+
+
+@click.command()
+@click.option('--connection', help='Connection string of a populated database')
+@click.option('--requests', type=int, default=2000, show_default=True, help='Requests per thread count')
+@click.option('--max-threads', type=int, default=16, show_default=True)
+def main(connection: Optional[str], requests: int, max_threads: int):
+    """Print the throughput of compound lookups for each number of threads."""
+    if connection is None:
+        _, path = tempfile.mkstemp(suffix='.db')
+        connection = f'sqlite:///{path}'
+        Manager(connection=connection).populate(
+            side_effects_url=os.path.join(TESTS, 'test_meddra_all_se.tsv'),
+            indications_url=os.path.join(TESTS, 'test_meddra_all_indications.tsv'),
+            frequencies_url=os.path.join(TESTS, 'test_meddra_freq.tsv'),
+            meddra_url=os.path.join(TESTS, 'test_meddra.tsv'),
+        )
+
+    threads = 1
+    while threads <= max_threads:
+        manager = Manager.from_connection_pool(connection=connection, pool_size=threads, max_overflow=0)
+        stitch_ids = [stitch_id for stitch_id, in manager.session.query(Compound.stitch_id)]
+        manager.session.remove()
+
+        t = time.time()
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            for future in [executor.submit(_run, manager, stitch_ids, requests // threads) for _ in range(threads)]:
+                future.result()
+        elapsed = time.time() - t
+
+        click.echo(f'{threads:>3} threads: {requests / elapsed:>10.1f} requests/s')
+        manager.engine.dispose()
+        threads *= 2
+
+
+if __name__ == '__main__':
+    main()
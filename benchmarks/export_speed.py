@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+
+"""Compare the time to export SIDER as a flat edge list directly versus through BEL.
+
+Run with ``python benchmarks/export_speed.py`` against a populated database.
+"""
+
+import os
+import tempfile
+import time
+from typing import Optional
+
+import click
+
+from bio2bel_sider import Manager
+
+
+@click.command()
+@click.option('--connection', help='Connection string of a populated database')
+def main(connection: Optional[str]):
+    """Print the time taken by each export route."""
+    manager = Manager(connection=connection)
+
+    t = time.time()
+    graph = manager.to_bel()
+    rows = [
+        (u.identifier, v.identifier, v.name, data['annotations'], data['relation'])
+        for u, v, data in graph.edges(data=True)
+    ]
+    click.echo(f'BEL:     {len(rows)} rows in {time.time() - t:.2f} seconds')
+
+    with tempfile.TemporaryDirectory() as directory:
+        t = time.time()
+        count = manager.export_edges(os.path.join(directory, 'sider.parquet'))
+        click.echo(f'Parquet: {count} rows in {time.time() - t:.2f} seconds')
+
+
+if __name__ == '__main__':
+    main()
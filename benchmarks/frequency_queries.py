@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+
+"""Time batch range queries over the side effect frequencies.
+
+Run with ``python benchmarks/frequency_queries.py`` against a database populated with the full SIDER files.
+"""
+
+import random
+import time
+from typing import Optional
+
+import click
+
+from bio2bel_sider import Manager
+from bio2bel_sider.models import Compound, Frequency, Umls
+
+
+@click.command()
+@click.option('--connection', help='Connection string of a populated database')
+@click.option('--batch-size', type=int, default=100, show_default=True, help='Identifiers per query')
+@click.option('--repeats', type=int, default=20, show_default=True)
+def main(connection: Optional[str], batch_size: int, repeats: int):
+    """Print the average time of range queries for batches of CUIs and of STITCH identifiers."""
+    manager = Manager(connection=connection)
+    cuis = [cui for cui, in manager.session.query(Umls.cui).join(Frequency).distinct()]
+    stitch_ids = [stitch_id for stitch_id, in manager.session.query(Compound.stitch_id).join(Frequency).distinct()]
+    click.echo(f'{manager.count_frequencies()} frequencies, {len(cuis)} CUIs, {len(stitch_ids)} compounds')
+
+    for name, identifiers, key in [('CUIs', cuis, 'cuis'), ('STITCH identifiers', stitch_ids, 'stitch_ids')]:
+        t = time.time()
+        results = 0
+        for _ in range(repeats):
+            batch = random.sample(identifiers, min(batch_size, len(identifiers)))
+            results += len(manager.get_frequencies(minimum=0.1, **{key: batch}))
+        elapsed = 1000 * (time.time() - t) / repeats
+        click.echo(f'{batch_size} {name} with frequency over 10%: {elapsed:.1f} ms/query ({results // repeats} rows)')
+
+
+if __name__ == '__main__':
+    main()
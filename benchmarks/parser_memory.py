@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+
+"""Benchmark the memory used by parsing each SIDER file with and without the typed getters.
+
+Run with ``python benchmarks/parser_memory.py``. Files are downloaded to the Bio2BEL data directory if necessary.
+"""
+
+import click
+import pandas as pd
+
+from bio2bel_sider.constants import (
+    DRUG_NAMES_HEADER, DRUG_NAMES_PATH, FREQUENCY_HEADER, FREQUENCY_PATH, INDICATIONS_HEADER, INDICATIONS_PATH,
+    MEDDRA_HEADER, MEDDRA_PATH, SIDE_EFFECTS_HEADER, SIDE_EFFECTS_PATH,
+)
+from bio2bel_sider.manager import INDICATIONS_COLUMNS, SIDE_EFFECTS_COLUMNS
+from bio2bel_sider.parser import (
+    get_drug_names_df, get_indications_df, get_meddra_df, get_se_frequency_df, get_side_effects_df,
+)
+
+#: name, getter, cached path, header, and the columns the manager actually uses
+BENCHMARKS = [
+    ('meddra', get_meddra_df, MEDDRA_PATH, MEDDRA_HEADER, None),
+    ('meddra_all_se', get_side_effects_df, SIDE_EFFECTS_PATH, SIDE_EFFECTS_HEADER, SIDE_EFFECTS_COLUMNS),
+    ('meddra_all_indications', get_indications_df, INDICATIONS_PATH, INDICATIONS_HEADER, INDICATIONS_COLUMNS),
+    ('drug_names', get_drug_names_df, DRUG_NAMES_PATH, DRUG_NAMES_HEADER, None),
+    ('meddra_freq', get_se_frequency_df, FREQUENCY_PATH, FREQUENCY_HEADER, None),
+]
+
+
+def _megabytes(df: pd.DataFrame) -> float:
+    return df.memory_usage(deep=True).sum() / 2 ** 20
+
+
+@click.command()
+def main():
+    """Print the deep memory usage of each SIDER file, untyped, typed, and typed with only the used columns."""
+    click.echo(f'{"file":<24}{"untyped (MB)":>14}{"typed (MB)":>14}{"usecols (MB)":>14}')
+    for name, getter, path, header, usecols in BENCHMARKS:
+        typed_df = getter()  # downloads the file, if necessary
+        untyped_df = pd.read_csv(path, sep='\t', names=header)
+        used_df = typed_df if usecols is None else getter(usecols=usecols)
+        click.echo(
+            f'{name:<24}{_megabytes(untyped_df):>14.1f}{_megabytes(typed_df):>14.1f}{_megabytes(used_df):>14.1f}',
+        )
+
+
+if __name__ == '__main__':
+    main()
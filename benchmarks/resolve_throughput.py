@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+"""Measure the throughput of resolving identifiers in bulk.
+
+Run with ``python benchmarks/resolve_throughput.py --connection ...`` against a populated database. Without a
+connection, a temporary SQLite database is populated from the test files.
+"""
+
+import os
+import random
+import tempfile
+import time
+from typing import Optional
+
+import click
+
+from bio2bel_sider import Manager
+from bio2bel_sider.models import Compound, MeddraTerm, Stereoisomer, Umls
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+TESTS = os.path.join(HERE, os.pardir, 'tests')
+
+
+def _get_identifiers(manager: Manager, size: int):
+    """Sample identifiers from the database in each namespace, plus as many that won't resolve."""
+    pubchem_ids = [pubchem_id for pubchem_id, in manager.session.query(Compound.pubchem_id)]
+    stereo_ids = [stitch_id for stitch_id, in manager.session.query(Stereoisomer.stitch_id)]
+    cuis = [cui for cui, in manager.session.query(Umls.cui)]
+    meddra_ids = [meddra_id for meddra_id, in manager.session.query(MeddraTerm.meddra_id)]
+
+    makers = [
+        lambda: random.choice(pubchem_ids),
+        lambda: f'CID1{int(random.choice(pubchem_ids)):08d}',
+        lambda: random.choice(stereo_ids),
+        lambda: random.choice(cuis),
+        lambda: f'meddra:{random.choice(meddra_ids)}',
+        lambda: f'C{random.randrange(10 ** 7):07d}',
+        lambda: str(random.randrange(10 ** 8)),
+    ]
+    return [random.choice(makers)() for _ in range(size)]
+
+
+@click.command()
+@click.option('--connection', help='Connection string of a populated database')
+@click.option('--size', type=int, default=100_000, show_default=True, help='Number of identifiers')
+def main(connection: Optional[str], size: int):
+    """Print the throughput of resolving a random sample of identifiers."""
+    if connection is None:
+        _, path = tempfile.mkstemp(suffix='.db')
+        connection = f'sqlite:///{path}'
+        Manager(connection=connection).populate(
+            side_effects_url=os.path.join(TESTS, 'test_meddra_all_se.tsv'),
+            indications_url=os.path.join(TESTS, 'test_meddra_all_indications.tsv'),
+            frequencies_url=os.path.join(TESTS, 'test_meddra_freq.tsv'),
+            meddra_url=os.path.join(TESTS, 'test_meddra.tsv'),
+        )
+
+    manager = Manager(connection=connection)
+    identifiers = _get_identifiers(manager, size)
+
+    t = time.time()
+    resolved, unresolved = manager.resolve(identifiers)
+    elapsed = time.time() - t
+
+    click.echo(f'resolved {len(resolved.index)} and could not resolve {len(unresolved.index)} of {size} identifiers')
+    click.echo(f'{elapsed:.2f} seconds, {size / elapsed:,.0f} identifiers/s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+
+"""Download the SIDER source files concurrently, only replacing cached copies that changed on the server.
+
+For each file, the ``ETag`` and ``Last-Modified`` headers from the server are stored next to the cached copy in a
+JSON file, and sent back on the next download so unchanged files are not transferred again. Files are downloaded to a
+``.part`` file first, which is resumed with a range request if a previous download was interrupted, and which only
+replaces the cached copy after its size and (for gzipped files) compression are checked. The SHA-256 digest of the
+cached copy is stored too, and checked whenever the server says the file is unchanged, so a cached copy that was
+modified or corrupted locally is downloaded again.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import shutil
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Mapping, Optional, Tuple
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+import click
+
+from .constants import (
+    DRUG_NAMES_PATH, DRUG_NAMES_URL, FREQUENCY_PATH, FREQUENCY_URL, INDICATIONS_PATH, INDICATIONS_URL, MEDDRA_PATH,
+    MEDDRA_URL, SIDE_EFFECTS_PATH, SIDE_EFFECTS_URL,
+)
+
+__all__ = [
+    'SOURCES',
+    'DownloadIntegrityError',
+    'download_file',
+    'download_all',
+    'add_cli_download',
+]
+
+log = logging.getLogger(__name__)
+
+#: Maps the name of each SIDER source file to its URL and cached path
+SOURCES = {
+    'meddra': (MEDDRA_URL, MEDDRA_PATH),
+    'meddra_all_se': (SIDE_EFFECTS_URL, SIDE_EFFECTS_PATH),
+    'meddra_all_indications': (INDICATIONS_URL, INDICATIONS_PATH),
+    'drug_names': (DRUG_NAMES_URL, DRUG_NAMES_PATH),
+    'meddra_freq': (FREQUENCY_URL, FREQUENCY_PATH),
+}
+
+DOWNLOADED = 'downloaded'
+NOT_MODIFIED = 'not modified'
+
+_CHUNK_SIZE = 2 ** 20
+
+
+class DownloadIntegrityError(ValueError):
+    """Raised when a downloaded file is truncated or corrupt."""
+
+
+def _get_metadata_path(path: str) -> str:
+    return f'{path}.json'
+
+
+def _read_metadata(path: str) -> dict:
+    metadata_path = _get_metadata_path(path)
+    if not os.path.exists(path) or not os.path.exists(metadata_path):
+        return {}
+    with open(metadata_path) as file:
+        return json.load(file)
+
+
+def _write_metadata(path: str, metadata: Mapping[str, Optional[str]]) -> None:
+    with open(_get_metadata_path(path), 'w') as file:
+        json.dump(metadata, file, indent=2)
+
+
+def _remove(path: str) -> None:
+    for p in (path, _get_metadata_path(path)):
+        if os.path.exists(p):
+            os.remove(p)
+
+
+def _get_sha256(path: str) -> str:
+    sha256 = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(_CHUNK_SIZE), b''):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def _is_cached_copy_intact(path: str, part_path: str) -> bool:
+    """Check the cached copy still has the digest stored when it was downloaded, and remove any stale download."""
+    # the server says the cached copy is up to date, so a partial download is of an outdated version
+    _remove(part_path)
+
+    expected_sha256 = _read_metadata(path).get('sha256')
+    return expected_sha256 is None or expected_sha256 == _get_sha256(path)
+
+
+def _get_expected_size(response, offset: int) -> Optional[int]:
+    content_range = response.headers.get('Content-Range')  # e.g., bytes 100-199/200
+    if content_range and '/' in content_range and not content_range.endswith('*'):
+        return int(content_range.rsplit('/', 1)[1])
+
+    content_length = response.headers.get('Content-Length')
+    if content_length is not None:
+        return offset + int(content_length)
+
+
+def _check_integrity(path: str, expected_size: Optional[int], gzipped: bool) -> None:
+    """Check that the file has the size the server announced and, if gzipped, that it decompresses."""
+    size = os.path.getsize(path)
+    if expected_size is not None and size != expected_size:
+        raise DownloadIntegrityError(f'{path} has {size} bytes but {expected_size} were expected')
+
+    if gzipped:
+        try:
+            with gzip.open(path) as file:
+                while file.read(_CHUNK_SIZE):
+                    pass
+        except (OSError, EOFError, zlib.error) as e:
+            raise DownloadIntegrityError(f'{path} is not a valid gzip file: {e}') from e
+
+
+def _get_headers(path: str, part_path: str, force: bool) -> Tuple[Dict[str, str], int]:
+    """Get the conditional and range headers for a download, and the offset from which it resumes."""
+    headers = {}
+
+    metadata = {} if force else _read_metadata(path)
+    if metadata.get('etag'):
+        headers['If-None-Match'] = metadata['etag']
+    if metadata.get('last_modified'):
+        headers['If-Modified-Since'] = metadata['last_modified']
+
+    part_metadata = _read_metadata(part_path)
+    offset = os.path.getsize(part_path) if part_metadata else 0
+    if offset:
+        headers['Range'] = f'bytes={offset}-'
+        # only resume if the file didn't change since the partial download, otherwise the server sends all of it
+        headers['If-Range'] = part_metadata.get('etag') or part_metadata.get('last_modified')
+
+    return headers, offset
+
+
+def _write_response(response, part_path: str, offset: int) -> Tuple[Dict[str, Optional[str]], Optional[int]]:
+    """Write the body of the response to the partial download, appending if the server sent a range.
+
+    :return: The validators of the file and the size it should have once downloaded
+    """
+    if response.status != 206:
+        offset = 0
+
+    validators = {
+        'etag': response.headers.get('ETag'),
+        'last_modified': response.headers.get('Last-Modified'),
+    }
+    expected_size = _get_expected_size(response, offset)
+
+    if not offset:
+        _remove(part_path)
+    if validators['etag'] or validators['last_modified']:
+        _write_metadata(part_path, validators)
+
+    with open(part_path, 'ab' if offset else 'wb') as file:
+        shutil.copyfileobj(response, file, _CHUNK_SIZE)
+
+    return validators, expected_size
+
+
+def download_file(url: str, path: str, force: bool = False, timeout: Optional[float] = 60) -> str:
+    """Download a file unless the cached copy is still up to date.
+
+    :param url: The URL of the file
+    :param path: The path of the cached copy
+    :param force: If true, download the file even if the server says the cached copy is up to date. Otherwise, it
+     is still downloaded again if it no longer matches the digest stored when it was downloaded.
+    :param timeout: The number of seconds to wait for the server
+    :return: Either ``'downloaded'`` or ``'not modified'``
+    :raises DownloadIntegrityError: If the downloaded file is truncated or corrupt. The cached copy is kept, and a
+     truncated download is resumed by the next call.
+    """
+    part_path = f'{path}.part'
+    headers, offset = _get_headers(path, part_path, force)
+
+    try:
+        response = urlopen(Request(url, headers=headers), timeout=timeout)  # noqa: S310
+    except HTTPError as e:
+        if e.code == 304:
+            if not _is_cached_copy_intact(path, part_path):
+                log.warning('%s does not match the digest stored when it was downloaded. downloading again', path)
+                return download_file(url, path, force=True, timeout=timeout)
+            log.info('%s is up to date', path)
+            return NOT_MODIFIED
+        if e.code == 416 and offset:  # the partial download can't be resumed
+            _remove(part_path)
+            return download_file(url, path, force=force, timeout=timeout)
+        raise
+
+    with response:
+        log.info('downloading %s to %s', url, path)
+        validators, expected_size = _write_response(response, part_path, offset)
+
+    try:
+        _check_integrity(part_path, expected_size, gzipped=path.endswith('.gz'))
+    except DownloadIntegrityError:
+        if expected_size is None or expected_size <= os.path.getsize(part_path):
+            _remove(part_path)  # corrupt rather than incomplete, so the next download can't resume from it
+        raise
+
+    os.replace(part_path, path)
+    _remove(part_path)
+    _write_metadata(path, dict(validators, sha256=_get_sha256(path)))
+    return DOWNLOADED
+
+
+def download_all(
+        sources: Optional[Mapping[str, Tuple[str, str]]] = None,
+        force: bool = False,
+        max_workers: Optional[int] = None,
+) -> Mapping[str, str]:
+    """Download all SIDER source files concurrently.
+
+    :param sources: A mapping from names to URLs and paths. Defaults to :data:`SOURCES`.
+    :param force: If true, download the files even if the cached copies are up to date
+    :param max_workers: The number of files to download at once. Defaults to all of them.
+    :return: A mapping from the name of each source to ``'downloaded'`` or ``'not modified'``
+    """
+    if sources is None:
+        sources = SOURCES
+
+    with ThreadPoolExecutor(max_workers=max_workers or len(sources)) as executor:
+        futures = {
+            name: executor.submit(download_file, url, path, force=force)
+            for name, (url, path) in sources.items()
+        }
+
+    return {
+        name: future.result()
+        for name, future in futures.items()
+    }
+
+
+def add_cli_download(main: click.Group) -> click.Group:  # noqa: D202
+    """Add a ``download`` command to main :mod:`click` function."""
+
+    @main.command()
+    @click.option('--force', is_flag=True, help='Download even if the cached files are up to date')
+    def download(force):
+        """Download the SIDER source files."""
+        for name, status in download_all(force=force).items():
+            click.echo(f'{name}: {status}')
+
+    return main
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+
+"""Export SIDER as a flat edge list in Parquet or Arrow IPC format.
+
+Requires :mod:`pyarrow`, which can be installed with the export extra like:
+
+.. code-block:: sh
+
+    pip install bio2bel_sider[export]
+"""
+
+import logging
+import os
+import time
+from typing import Iterable, List, Optional
+
+import click
+import pandas as pd
+from sqlalchemy import distinct, literal, null, select
+
+from .models import Compound, Detection, Indication, MeddraType, SideEffect, Umls
+
+__all__ = [
+    'EXPORT_COLUMNS',
+    'export_edges',
+    'add_cli_export',
+]
+
+log = logging.getLogger(__name__)
+
+EXPORT_COLUMNS = [
+    'pubchem_id',
+    'cui',
+    'name',
+    'meddra_type',
+    'detection',
+    'relation',
+]
+
+FORMATS = ['parquet', 'arrow', 'arrows']
+
+#: Maps file extensions to export formats
+EXTENSION_TO_FORMAT = {
+    '.parquet': 'parquet',
+    '.pq': 'parquet',
+    '.arrow': 'arrow',
+    '.feather': 'arrow',
+    '.arrows': 'arrows',
+}
+
+DEFAULT_CHUNK_SIZE = 100_000
+
+
+def _get_side_effects_query():
+    return select([
+        Compound.pubchem_id,
+        Umls.cui,
+        Umls.name,
+        MeddraType.name,
+        null(),
+        literal('increases'),
+    ]).select_from(
+        SideEffect.__table__.join(Compound.__table__).join(Umls.__table__).join(MeddraType.__table__),
+    ).order_by(SideEffect.id)
+
+
+def _get_indications_query():
+    return select([
+        Compound.pubchem_id,
+        Umls.cui,
+        Umls.name,
+        MeddraType.name,
+        Detection.name,
+        literal('decreases'),
+    ]).select_from(
+        Indication.__table__.join(Compound.__table__).join(Umls.__table__).join(MeddraType.__table__)
+        .join(Detection.__table__),
+    ).order_by(Indication.id)
+
+
+def _iterate_chunks(connection, chunk_size: int) -> Iterable[list]:
+    """Stream the joined side effect then indication rows out of the database in lists of at most the given size."""
+    for query in (_get_side_effects_query(), _get_indications_query()):
+        result = connection.execution_options(stream_results=True).execute(query)
+        while True:
+            rows = result.fetchmany(chunk_size)
+            if not rows:
+                break
+            yield rows
+
+
+def _get_dictionaries(connection) -> List[List[str]]:
+    """Get the distinct values that can appear in each column, so all chunks share the same dictionaries."""
+    return [
+        sorted(value for value, in connection.execute(select([distinct(column)])) if value is not None)
+        for column in (Compound.pubchem_id, Umls.cui, Umls.name, MeddraType.name, Detection.name)
+    ] + [['decreases', 'increases']]
+
+
+def _encode(column: tuple, categories: pd.Index, dictionary):
+    """Encode the values of a column as indexes into the dictionary, with missing values as nulls."""
+    import pyarrow as pa
+
+    values = pd.Series(column, dtype=object)
+    codes = pd.Categorical(values, categories=categories).codes.astype('int32')
+    missing = codes < 0
+    unknown = missing & values.notna().to_numpy()
+    if unknown.any():
+        raise ValueError(f'values missing from the export dictionary: {sorted(set(values[unknown]))}')
+    return pa.DictionaryArray.from_arrays(pa.array(codes, mask=missing), dictionary)
+
+
+def _open_writer(path: str, fmt: str, schema):
+    """Open a writer for the format and get its function for writing a record batch."""
+    import pyarrow as pa
+
+    if fmt == 'parquet':
+        import pyarrow.parquet as pq
+        writer = pq.ParquetWriter(path, schema)
+        return writer, lambda batch: writer.write_table(pa.Table.from_batches([batch]))
+
+    if fmt == 'arrow':
+        writer = pa.ipc.new_file(path, schema)
+    else:
+        writer = pa.ipc.new_stream(path, schema)
+    return writer, writer.write_batch
+
+
+def export_edges(manager, path: str, fmt: Optional[str] = None, chunk_size: Optional[int] = None) -> int:
+    """Write the side effects and indications as a flat table with dictionary-encoded string columns.
+
+    Rows are streamed from the database and written in chunks, so memory use is bounded by the chunk size. Every
+    chunk is encoded against the same dictionaries, built from the distinct values in the database up front, which
+    the Arrow IPC file format requires. Both are read in one transaction, so the rows only have values from the
+    dictionaries.
+
+    :param manager: A SIDER manager
+    :param path: The output path
+    :param fmt: Either ``parquet``, ``arrow`` for the Arrow IPC file format (also read as Feather), or ``arrows`` for
+     the Arrow IPC streaming format. If not given, inferred from the extension of the path.
+    :param chunk_size: The number of rows per chunk
+    :return: The number of rows written
+    :raises ValueError: If a row has a value that isn't in the dictionaries, which would otherwise be written as null
+    """
+    import pyarrow as pa
+
+    if fmt is None:
+        fmt = EXTENSION_TO_FORMAT.get(os.path.splitext(path)[1].lower())
+    if fmt not in FORMATS:
+        raise ValueError(f'can not infer format for {path}. Use one of {", ".join(FORMATS)}')
+
+    schema = pa.schema([
+        (column, pa.dictionary(pa.int32(), pa.string()))
+        for column in EXPORT_COLUMNS
+    ])
+
+    t = time.time()
+    count = 0
+    with manager.engine.connect() as connection, connection.begin():
+        categories = [pd.Index(values, dtype=object) for values in _get_dictionaries(connection)]
+        dictionaries = [pa.array(values, type=pa.string()) for values in categories]
+
+        writer, write = _open_writer(path, fmt, schema)
+        try:
+            for rows in _iterate_chunks(connection, chunk_size or DEFAULT_CHUNK_SIZE):
+                arrays = [
+                    _encode(column, column_categories, dictionary)
+                    for column, column_categories, dictionary in zip(zip(*rows), categories, dictionaries)
+                ]
+                write(pa.RecordBatch.from_arrays(arrays, schema=schema))
+                count += len(rows)
+        finally:
+            writer.close()
+
+    log.info('exported %d edges to %s in %.2f seconds', count, path, time.time() - t)
+    return count
+
+
+def add_cli_export(main: click.Group) -> click.Group:  # noqa: D202
+    """Add an ``export`` command to main :mod:`click` function."""
+
+    @main.command()
+    @click.option('-o', '--output', type=click.Path(dir_okay=False), required=True,
+                  help='Output path ending in .parquet, .arrow, or .arrows')
+    @click.option('-f', '--fmt', type=click.Choice(FORMATS), help='Override the output format')
+    @click.option('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, show_default=True)
+    @click.pass_obj
+    def export(manager, output, fmt, chunk_size):
+        """Export side effects and indications as a flat edge list."""
+        count = export_edges(manager, output, fmt=fmt, chunk_size=chunk_size)
+        click.echo(f'Exported {count} edges to {output}')
+
+    return main
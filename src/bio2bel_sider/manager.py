@@ -2,10 +2,21 @@
 
 """Manager for Bio2BEL SIDER."""
 
+import hashlib
 import logging
+import threading
 import time
-from typing import Dict, Mapping, Optional, Type
-
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Type
+
+import click
+import pandas as pd
+from sqlalchemy import create_engine, distinct, event, func, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine.url import make_url
+from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy.orm.util import identity_key
+from sqlalchemy.pool import QueuePool, StaticPool
 from tqdm import tqdm
 
 from bio2bel import AbstractManager
@@ -13,9 +24,15 @@ from bio2bel.manager.bel_manager import BELManagerMixin
 from bio2bel.manager.flask_manager import FlaskMixin
 from pybel import BELGraph
 from .constants import MODULE_NAME
-from .models import Base, Compound, Detection, Indication, MeddraType, SideEffect, Umls
-from .parser import get_indications_df, get_meddra_df, get_side_effects_df
-from .utils import convert_flat_stitch_id_to_pubchem_cid
+from .download import add_cli_download
+from .export import add_cli_export, export_edges
+from .models import (
+    Base, Checkpoint, Compound, Detection, Frequency, Indication, MeddraTerm, MeddraType, SideEffect, Statistic,
+    Stereoisomer, Umls,
+)
+from .parser import get_indications_df, get_meddra_df, get_se_frequency_df, get_side_effects_df
+from .resolve import add_cli_resolve, resolve_identifiers
+from .utils import _convert_stereo_stitch_id_to_pubchem_cid, convert_flat_stitch_id_to_pubchem_cid
 
 log = logging.getLogger(__name__)
 
@@ -29,11 +46,96 @@ INDICATIONS_COLUMNS = [
 
 SIDE_EFFECTS_COLUMNS = [
     'STITCH_FLAT_ID',
+    'STITCH_STEREO_ID',
+    'MedDRA Concept Type',
+    'UMLS CUI from MedDRA',
+    'MedDRA Concept name',
+]
+
+FREQUENCY_COLUMNS = [
+    'STITCH_FLAT_ID',
+    'Type of effect',
+    'Frequency description',
+    'Frequency lower bound',
+    'Frequency upper bound',
     'MedDRA Concept Type',
     'UMLS CUI from MedDRA',
     'MedDRA Concept name',
 ]
 
+#: The number of rows committed at once during population
+DEFAULT_CHECKPOINT_SIZE = 10_000
+
+#: The names of the sources loaded by :meth:`Manager.populate`, used to look up their checkpoints
+POPULATION_SOURCES = ['Indications', 'Side Effects', 'Frequencies', 'MedDRA']
+
+#: Maps the edge models to the precomputed counts of distinct UMLS entries per compound and distinct compounds per
+#: UMLS entry over them
+ENTITY_COUNT_COLUMNS = {
+    SideEffect: (Compound.side_effect_count, Umls.side_effect_compound_count),
+    Indication: (Compound.indication_count, Umls.indication_compound_count),
+}
+
+#: The number of identifiers per ``IN`` clause when recounting, which stays below SQLite's limit on bound parameters
+_IDS_CHUNK_SIZE = 500
+
+
+def _fingerprint_df(df: pd.DataFrame) -> str:
+    """Hash the contents of a data frame, independent of its dtypes being categorical or not."""
+    return hashlib.sha256(pd.util.hash_pandas_object(df, index=False).values.tobytes()).hexdigest()
+
+
+class ReadOnlySessionError(RuntimeError):
+    """Raised when a session built by :func:`build_read_only_engine_session` is flushed."""
+
+
+def _raise_read_only(session, flush_context, instances):
+    raise ReadOnlySessionError('can not write with a read-only session')
+
+
+def build_read_only_engine_session(
+        connection: str,
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        pool_timeout: float = 30.0,
+) -> Tuple[Engine, scoped_session]:
+    """Build a pooled engine and a thread-local, read-only session for serving concurrent requests.
+
+    Each thread gets its own session from the :class:`sqlalchemy.orm.scoped_session`, which should be released with
+    ``session.remove()`` when the thread is done with a request. Flushing raises a :class:`ReadOnlySessionError`.
+
+    :param connection: An RFC-1738 database connection string
+    :param pool_size: The number of connections to keep open in the pool
+    :param max_overflow: The number of connections that can be opened beyond the pool size
+    :param pool_timeout: The number of seconds to wait for a connection from the pool
+    """
+    url = make_url(connection)
+    if url.get_backend_name() != 'sqlite':
+        engine = create_engine(
+            url,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
+            pool_pre_ping=True,
+        )
+    elif url.database in {None, '', ':memory:'}:
+        # every connection to an in-memory SQLite database gets its own database, so share a single one
+        engine = create_engine(url, connect_args={'check_same_thread': False}, poolclass=StaticPool)
+    else:
+        engine = create_engine(
+            url,
+            connect_args={'check_same_thread': False},
+            poolclass=QueuePool,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
+        )
+
+    session_maker = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+    event.listen(session_maker, 'before_flush', _raise_read_only)
+
+    return engine, scoped_session(session_maker)
+
 
 class Manager(AbstractManager, BELManagerMixin, FlaskMixin):
     """Drugs' side effects and indications."""
@@ -41,19 +143,50 @@ class Manager(AbstractManager, BELManagerMixin, FlaskMixin):
     _base = Base
     module_name = MODULE_NAME
     edge_model = [Indication, SideEffect]
-    flask_admin_models = [Compound, Umls, Indication, SideEffect]
+    flask_admin_models = [Compound, Umls, Indication, SideEffect, Frequency]
 
     def __init__(self, *args, **kwargs):  # noqa: D107
         super().__init__(*args, **kwargs)
 
+        #: Guards the lookup caches below, which map names and identifiers to primary keys and are shared by all
+        #: threads using this manager
+        self._cache_lock = threading.Lock()
         self.stitch_id_to_compound = {}
+        self.stitch_id_to_stereoisomer = {}
         self.cui_to_umls = {}
         self.meddra_types = {}
         self.detections = {}
 
+        #: Maps model classes and values to the models looked up or created while populating. These are strong
+        #: references, so the models stay in the writing session's identity map across commits, where the caches
+        #: above would have to load them again. None outside of population.
+        self._population_models: Optional[Dict[Tuple[Type[Base], str], Base]] = None
+
+    @classmethod
+    def from_connection_pool(cls, connection: Optional[str] = None, **kwargs) -> 'Manager':
+        """Build a manager that can be shared by threads serving read-only requests.
+
+        :param connection: An RFC-1738 database connection string. Defaults to the Bio2BEL configuration.
+        :param kwargs: Keyword arguments to pass to :func:`build_read_only_engine_session`
+
+        >>> manager = Manager.from_connection_pool(pool_size=10)
+        >>> compound = manager.get_compound_by_stitch_id('CID100000085')
+        >>> manager.session.remove()  # release this thread's session when done with a request
+        """
+        engine, session = build_read_only_engine_session(cls._get_connection(connection), **kwargs)
+        return cls(engine=engine, session=session)
+
     def is_populated(self) -> bool:
-        """Check if the database is already populated."""
-        return 0 < self.count_compounds()
+        """Check if the database is already populated, meaning every source was loaded completely.
+
+        A population that was interrupted has committed some rows already, but isn't populated, so running it again
+        continues from the last checkpoint.
+        """
+        complete = {
+            source
+            for source, in self.session.query(Checkpoint.source).filter(Checkpoint.row_offset == Checkpoint.row_total)
+        }
+        return complete.issuperset(POPULATION_SOURCES)
 
     def count_compounds(self) -> int:
         """Count the number of compounds in the database."""
@@ -71,33 +204,151 @@ class Manager(AbstractManager, BELManagerMixin, FlaskMixin):
         """Count the number of UMLS entries in the database."""
         return self._count_model(Umls)
 
-    def summarize(self) -> Mapping[str, int]:
-        """Summarize the contents of the database."""
+    def count_frequencies(self) -> int:
+        """Count the number of side effect frequencies in the database."""
+        return self._count_model(Frequency)
+
+    def count_meddra_terms(self) -> int:
+        """Count the number of MedDRA terms in the database."""
+        return self._count_model(MeddraTerm)
+
+    def _count_all(self) -> Mapping[str, int]:
         return dict(
             compounds=self.count_compounds(),
             side_effects=self.count_side_effects(),
             indications=self.count_indications(),
+            frequencies=self.count_frequencies(),
             umls=self.count_umls(),
+            meddra_terms=self.count_meddra_terms(),
         )
 
+    def summarize(self) -> Mapping[str, int]:
+        """Summarize the contents of the database.
+
+        Reads the counts stored with each checkpoint of :meth:`populate` and falls back to counting each table if
+        they have not been stored yet.
+        """
+        rv = dict(self.session.query(Statistic.name, Statistic.count))
+        if not rv:
+            return self._count_all()
+        return rv
+
+    def update_statistics(self) -> None:
+        """Rebuild the summary counts and the per-compound and per-UMLS counts from scratch.
+
+        :meth:`populate` keeps these up to date with each checkpoint it commits, so this is only needed after loading
+        data some other way.
+        """
+        t = time.time()
+        log.info('updating statistics')
+
+        for edge_model in ENTITY_COUNT_COLUMNS:
+            self._update_entity_counts(edge_model)
+        self._store_statistics()
+
+        self.session.commit()
+        log.info('updated statistics in %.2f seconds', time.time() - t)
+
+    def _update_entity_counts(
+            self,
+            edge_model: Type[Base],
+            compound_ids: Optional[Iterable[int]] = None,
+            umls_ids: Optional[Iterable[int]] = None,
+    ) -> None:
+        """Recount the distinct UMLS entries of each compound and the distinct compounds of each UMLS entry.
+
+        :param edge_model: Either :class:`SideEffect` or :class:`Indication`
+        :param compound_ids: The compounds to recount. Defaults to all of them.
+        :param umls_ids: The UMLS entries to recount. Defaults to all of them.
+        """
+        compound_column, umls_column = ENTITY_COUNT_COLUMNS[edge_model]
+        for model, column, key, counted_key, ids in [
+            (Compound, compound_column, edge_model.compound_id, edge_model.umls_id, compound_ids),
+            (Umls, umls_column, edge_model.umls_id, edge_model.compound_id, umls_ids),
+        ]:
+            values = {column: select([func.count(distinct(counted_key))]).where(key == model.id).as_scalar()}
+            if ids is None:
+                self.session.query(model).update(values, synchronize_session=False)
+                continue
+
+            ids = sorted(ids)
+            for start in range(0, len(ids), _IDS_CHUNK_SIZE):
+                self.session.query(model).filter(model.id.in_(ids[start:start + _IDS_CHUNK_SIZE])).update(
+                    values, synchronize_session=False,
+                )
+
+    def _store_statistics(self) -> None:
+        """Store the current size of each table for :meth:`summarize`."""
+        statistics = {statistic.name: statistic for statistic in self.session.query(Statistic)}
+        for name, count in self._count_all().items():
+            statistic = statistics.get(name)
+            if statistic is None:
+                self.session.add(Statistic(name=name, count=count))
+            else:
+                statistic.count = count
+
+    def get_top_compounds(self, n: int = 10) -> List[Compound]:
+        """Get the compounds with the most distinct side effects.
+
+        :param n: The number of compounds to return
+        """
+        return self.session.query(Compound).order_by(Compound.side_effect_count.desc()).limit(n).all()
+
+    def get_top_side_effects(self, n: int = 10) -> List[Umls]:
+        """Get the side effects caused by the most distinct compounds.
+
+        :param n: The number of side effects to return
+        """
+        return self.session.query(Umls).order_by(Umls.side_effect_compound_count.desc()).limit(n).all()
+
+    def get_frequencies(
+            self,
+            cuis: Optional[Iterable[str]] = None,
+            stitch_ids: Optional[Iterable[str]] = None,
+            minimum: Optional[float] = None,
+            maximum: Optional[float] = None,
+            placebo: Optional[bool] = False,
+    ) -> List[Frequency]:
+        """Get the side effect frequencies whose bounds lie within the given range.
+
+        For example, the drugs that cause nausea in more than 10% of patients are given by
+        ``manager.get_frequencies(cuis=['C0027497'], minimum=0.1)``.
+
+        :param cuis: If given, only get frequencies of side effects with these UMLS CUIs
+        :param stitch_ids: If given, only get frequencies of compounds with these STITCH identifiers
+        :param minimum: If given, the lower bound of the frequency must be at least this, between 0 and 1
+        :param maximum: If given, the upper bound of the frequency must be at most this, between 0 and 1
+        :param placebo: If true, only get frequencies observed with placebo. If false, only with the drug. If none,
+         get both.
+        """
+        query = self.session.query(Frequency)
+
+        if cuis is not None:
+            query = query.join(Umls).filter(Umls.cui.in_(list(cuis)))
+        if stitch_ids is not None:
+            query = query.join(Compound).filter(Compound.stitch_id.in_(list(stitch_ids)))
+        if minimum is not None:
+            query = query.filter(Frequency.lower_bound >= minimum)
+        if maximum is not None:
+            query = query.filter(Frequency.upper_bound <= maximum)
+        if placebo is not None:
+            query = query.filter(Frequency.placebo == placebo)
+
+        return query.all()
+
     def get_compound_by_stitch_id(self, stitch_id: str) -> Optional[Compound]:
         """Get a compound by its STITCH identifier, if it exists."""
         return self.session.query(Compound).filter(Compound.stitch_id == stitch_id).one_or_none()
 
     def get_or_create_compound(self, stitch_id: str, **kwargs) -> Compound:
         """Get a compound by its STITCH identifier, or create one if it doesn't exist."""
-        model = self.stitch_id_to_compound.get(stitch_id)
-        if model is not None:
-            return model
+        return self._get_or_create_model(self.stitch_id_to_compound, Compound, 'stitch_id', stitch_id, **kwargs)
 
-        model = self.get_compound_by_stitch_id(stitch_id)
-        if model is not None:
-            self.stitch_id_to_compound[stitch_id] = model
-            return model
-
-        model = self.stitch_id_to_compound[stitch_id] = Compound(stitch_id=stitch_id, **kwargs)
-        self.session.add(model)
-        return model
+    def get_or_create_stereoisomer(self, stitch_id: str, **kwargs) -> Stereoisomer:
+        """Get a stereoisomer by its STITCH stereo identifier, or create one if it doesn't exist."""
+        return self._get_or_create_model(
+            self.stitch_id_to_stereoisomer, Stereoisomer, 'stitch_id', stitch_id, **kwargs,
+        )
 
     def get_umls_by_cui(self, cui: str) -> Optional[Umls]:
         """Get a UMLS by its CUI, if it exists."""
@@ -105,33 +356,81 @@ class Manager(AbstractManager, BELManagerMixin, FlaskMixin):
 
     def get_or_create_umls(self, cui: str, **kwargs) -> Umls:
         """Get a UMLS by its CUI, or create one if it does not exist."""
-        model = self.cui_to_umls.get(cui)
-        if model is not None:
-            return model
+        return self._get_or_create_model(self.cui_to_umls, Umls, 'cui', cui, **kwargs)
 
-        model = self.get_umls_by_cui(cui)
-        if model is not None:
-            self.cui_to_umls[cui] = model
-            return model
+    def _get_or_create_model(self, d: Dict[str, int], m: Type[Base], n, i: str, **kwargs) -> Type[Base]:
+        """Get a model by the value of the given column, or create one if it doesn't exist.
 
-        model = self.cui_to_umls[cui] = Umls(cui=cui, **kwargs)
-        self.session.add(model)
-        return model
+        The cache maps values to primary keys rather than models, since models are bound to the session of the thread
+        that loaded them. The lock is only held while reading and writing the cache. While populating, the models
+        are kept in :attr:`_population_models` instead, so each one is only queried or created once.
+        """
+        if self._population_models is not None:
+            return self._get_or_create_population_model(m, n, i, **kwargs)
+
+        with self._cache_lock:
+            pk = d.get(i)
 
-    def _get_or_create_model(self, d: Dict[str, Type[Base]], m: Type[Base], n, i: str, **kwargs) -> Type[Base]:
-        model = d.get(i)
-        if model is not None:
-            return model
+        if pk is not None:
+            model = self.session.identity_map.get(identity_key(m, pk))
+            if model is not None:
+                return model
+            return self.session.query(m).get(pk)
 
         model = self.session.query(m).filter_by(**{n: i}).one_or_none()
-        if model is not None:
-            d[i] = model
-            return model
+        if model is None:
+            model = m(**{n: i}, **kwargs)
+            self.session.add(model)
+            self.session.flush()  # assigns the primary key
 
-        model = d[i] = m(**{n: i}, **kwargs)
-        self.session.add(model)
+        with self._cache_lock:
+            d[i] = model.id
         return model
 
+    def _get_or_create_population_model(self, m: Type[Base], n, i: str, **kwargs) -> Base:
+        model = self._population_models.get((m, i))
+        if model is None:
+            model = self.session.query(m).filter_by(**{n: i}).one_or_none()
+            if model is None:
+                model = m(**{n: i}, **kwargs)
+                self.session.add(model)
+            self._population_models[m, i] = model
+        return model
+
+    @contextmanager
+    def _keep_population_models(self):
+        """Keep the models looked up or created in this block for the rest of it, unless one is already open.
+
+        The session doesn't expire its models on commit in the meantime, since each checkpoint would otherwise load
+        every kept model again the next time it is used.
+        """
+        if self._population_models is not None:
+            yield
+            return
+
+        session = self.session() if isinstance(self.session, scoped_session) else self.session
+        expire_on_commit, session.expire_on_commit = session.expire_on_commit, False
+        self._population_models = {}
+        try:
+            yield
+        finally:
+            self._population_models = None
+            session.expire_on_commit = expire_on_commit
+
+    def _clear_caches(self) -> None:
+        """Clear the lookup caches, e.g., after a rollback discards the models they refer to."""
+        with self._cache_lock:
+            for d in (
+                    self.stitch_id_to_compound,
+                    self.stitch_id_to_stereoisomer,
+                    self.cui_to_umls,
+                    self.meddra_types,
+                    self.detections,
+            ):
+                d.clear()
+        if self._population_models is not None:
+            self._population_models.clear()
+
     def get_or_create_detection(self, name: str) -> Detection:
         """Get a detection by its name, or create one if it doesn't exist."""
         return self._get_or_create_model(self.detections, Detection, 'name', name)
@@ -140,66 +439,180 @@ class Manager(AbstractManager, BELManagerMixin, FlaskMixin):
         """Get a MedDRA type by its name, or create one if it doesn't exit."""
         return self._get_or_create_model(self.meddra_types, MeddraType, 'name', name)
 
-    def _populate_indications(self, url: Optional[str] = None):
+    def _populate_checkpointed(
+            self,
+            source: str,
+            model: Type[Base],
+            df: pd.DataFrame,
+            make_model: Callable[..., Base],
+            checkpoint_size: Optional[int] = None,
+    ) -> None:
+        """Add a model for each row of the data frame, committing every ``checkpoint_size`` rows.
+
+        The number of committed rows is stored with a fingerprint of the data frame in a :class:`Checkpoint`, so a
+        run that was interrupted continues where it left off. If the data changed since the last run, the models
+        already loaded from this source are deleted and it starts over.
+
+        Each checkpoint is committed with the summary counts and, for side effects and indications, the counts of the
+        compounds and UMLS entries in it, so these always match the committed rows, even after an interruption.
+
+        :param source: The name of the source, used to look up its checkpoint
+        :param model: The model built from each row
+        :param df: The data frame whose rows are passed to ``make_model``
+        :param make_model: A function that builds a model from a row of the data frame
+        :param checkpoint_size: The number of rows to commit at once. Defaults to :data:`DEFAULT_CHECKPOINT_SIZE`.
+        """
+        checkpoint_size = checkpoint_size or DEFAULT_CHECKPOINT_SIZE
+        fingerprint = _fingerprint_df(df)
+        total = len(df.index)
+        checkpoint = self.session.query(Checkpoint).filter(Checkpoint.source == source).one_or_none()
+        if checkpoint is None:
+            checkpoint = Checkpoint(source=source, fingerprint=fingerprint, row_offset=0, row_total=total)
+            self.session.add(checkpoint)
+        elif checkpoint.fingerprint != fingerprint:
+            log.warning('%s changed since the last population. starting over', source)
+            self.session.query(model).delete()
+            if model in ENTITY_COUNT_COLUMNS:
+                self.session.query(Compound).update({ENTITY_COUNT_COLUMNS[model][0]: 0}, synchronize_session=False)
+                self.session.query(Umls).update({ENTITY_COUNT_COLUMNS[model][1]: 0}, synchronize_session=False)
+            checkpoint.fingerprint = fingerprint
+            checkpoint.row_offset = 0
+            checkpoint.row_total = total
+
+        offset = checkpoint.row_offset
+        if offset:
+            log.info('resuming %s from row %d of %d', source, offset, total)
+
+        t = time.time()
+        it = tqdm(df.iloc[offset:].itertuples(index=False), total=total, initial=offset, desc=source)
+        batch = []
+        with self._keep_population_models():
+            try:
+                for row_number, row in enumerate(it, start=offset + 1):
+                    batch.append(make_model(*row))
+                    if row_number % checkpoint_size == 0:
+                        checkpoint.row_offset = row_number
+                        self._commit_batch(model, batch)
+
+                checkpoint.row_offset = total
+                self._commit_batch(model, batch)
+            except Exception:
+                self.session.rollback()
+                self._clear_caches()
+                raise
+
+        log.info('populated %s in %.2f seconds', source, time.time() - t)
+
+    def _commit_batch(self, model: Type[Base], batch: List[Base]) -> None:
+        """Add and commit a batch of models with the counts they change, then empty it."""
+        self.session.add_all(batch)
+        self.session.flush()  # assigns the foreign keys, and makes the rows visible to the counts
+        if model in ENTITY_COUNT_COLUMNS:
+            self._update_entity_counts(
+                model,
+                compound_ids={instance.compound_id for instance in batch},
+                umls_ids={instance.umls_id for instance in batch},
+            )
+        self._store_statistics()
+        self.session.commit()
+        batch.clear()
+
+    def _make_indication(self, stitch_id, detection, meddra_type, cui, concept_name) -> Indication:
+        pubchem_id = convert_flat_stitch_id_to_pubchem_cid(stitch_id)
+        return Indication(
+            compound=self.get_or_create_compound(stitch_id=stitch_id, pubchem_id=pubchem_id),
+            umls=self.get_or_create_umls(cui=cui, name=concept_name),
+            meddra_type=self.get_or_create_meddra_type(meddra_type),
+            detection=self.get_or_create_detection(detection),
+        )
+
+    def _populate_indications(self, url: Optional[str] = None, checkpoint_size: Optional[int] = None):
         """Populate compound indications.
 
         :param url: A custom URL for the indications data source
+        :param checkpoint_size: The number of rows to commit at once
         """
-        indications_df = get_indications_df(url=url)
+        indications_df = get_indications_df(url=url, usecols=INDICATIONS_COLUMNS)
         indications_df = indications_df.loc[indications_df['UMLS CUI from MedDRA'].notna(), INDICATIONS_COLUMNS]
         log.info('populating indications effects')
+        self._populate_checkpointed('Indications', Indication, indications_df, self._make_indication, checkpoint_size)
 
-        it = tqdm(indications_df.itertuples(), total=len(indications_df.index), desc='Indications')
-        for _, stitch_id, detection, meddra_type, cui, concept_name in it:
-            pubchem_id = convert_flat_stitch_id_to_pubchem_cid(stitch_id)
-            se_flat = Indication(
-                compound=self.get_or_create_compound(stitch_id=stitch_id, pubchem_id=pubchem_id),
-                umls=self.get_or_create_umls(cui=cui, name=concept_name),
-                meddra_type=self.get_or_create_meddra_type(meddra_type),
-                detection=self.get_or_create_detection(detection)
-            )
-            self.session.add(se_flat)
+    def _make_side_effect(self, stitch_id, stitch_stereo_id, meddra_type, cui, side_effect_name) -> SideEffect:
+        pubchem_id = convert_flat_stitch_id_to_pubchem_cid(stitch_id)
+        compound = self.get_or_create_compound(stitch_id=stitch_id, pubchem_id=pubchem_id)
 
-        t = time.time()
-        log.info('committing indications')
-        self.session.commit()
-        log.info('committed indications in %.2f seconds', time.time() - t)
+        # side effects are only stored for the flat compound, but the stereo identifier is kept so it can be resolved
+        self.get_or_create_stereoisomer(
+            stitch_id=stitch_stereo_id,
+            pubchem_id=_convert_stereo_stitch_id_to_pubchem_cid(stitch_stereo_id),
+            compound=compound,
+        )
+
+        return SideEffect(
+            compound=compound,
+            umls=self.get_or_create_umls(cui=cui, name=side_effect_name),
+            meddra_type=self.get_or_create_meddra_type(meddra_type),
+        )
 
-    def _populate_side_effects(self, url: Optional[str] = None):
+    def _populate_side_effects(self, url: Optional[str] = None, checkpoint_size: Optional[int] = None):
         """Populate compound side effects.
 
         Done in two steps, using both the indications and the side effects documents.
 
         :param url: A custom URL for the side effects data source
+        :param checkpoint_size: The number of rows to commit at once
         """
-        side_effects_df = get_side_effects_df(url=url)
+        side_effects_df = get_side_effects_df(url=url, usecols=SIDE_EFFECTS_COLUMNS)
         side_effects_df = side_effects_df.loc[side_effects_df['UMLS CUI from MedDRA'].notna(), SIDE_EFFECTS_COLUMNS]
-
         log.info('populating side effects')
-        it = tqdm(side_effects_df.itertuples(), total=len(side_effects_df.index), desc='Side Effects')
-        for _, stitch_id, meddra_type, cui, side_effect_name in it:
-            pubchem_id = convert_flat_stitch_id_to_pubchem_cid(stitch_id)
-
-            se_flat = SideEffect(
-                compound=self.get_or_create_compound(stitch_id=stitch_id, pubchem_id=pubchem_id),
-                umls=self.get_or_create_umls(cui=cui, name=side_effect_name),
-                meddra_type=self.get_or_create_meddra_type(meddra_type),
-            )
+        self._populate_checkpointed(
+            'Side Effects', SideEffect, side_effects_df, self._make_side_effect, checkpoint_size,
+        )
 
-            self.session.add(se_flat)
+    def _make_frequency(
+            self,
+            stitch_id,
+            effect_type,
+            description,
+            lower_bound,
+            upper_bound,
+            meddra_type,
+            cui,
+            side_effect_name,
+    ) -> Frequency:
+        pubchem_id = convert_flat_stitch_id_to_pubchem_cid(stitch_id)
+        return Frequency(
+            compound=self.get_or_create_compound(stitch_id=stitch_id, pubchem_id=pubchem_id),
+            umls=self.get_or_create_umls(cui=cui, name=side_effect_name),
+            meddra_type=self.get_or_create_meddra_type(meddra_type),
+            placebo=effect_type == 'placebo',
+            description=None if pd.isna(description) else description,
+            lower_bound=None if pd.isna(lower_bound) else float(lower_bound),
+            upper_bound=None if pd.isna(upper_bound) else float(upper_bound),
+        )
 
-            # Maybe use stereochemistry later?
-            # pubchem_stereo_id = _convert_stereo(stitch_stereo_id)
-            # stereo_model = self.get_or_create_compound(stitch_id=stitch_stereo_id,
-            #                                            pubchem_id=pubchem_stereo_id,parent=flat_model)
-            # se_stereo = CompoundSideEffect(compound=stereo_model, side_effect=umls)
+    def _populate_frequencies(self, url: Optional[str] = None, checkpoint_size: Optional[int] = None):
+        """Populate the frequencies of compound side effects.
 
-        t = time.time()
-        log.info('committing side effects')
-        self.session.commit()
-        log.info('committed side effects in %.2f seconds', time.time() - t)
+        :param url: A custom URL for the side effect frequencies data source
+        :param checkpoint_size: The number of rows to commit at once
+        """
+        frequency_df = get_se_frequency_df(url=url, usecols=FREQUENCY_COLUMNS)
+        frequency_df = frequency_df.loc[frequency_df['UMLS CUI from MedDRA'].notna(), FREQUENCY_COLUMNS]
+        log.info('populating side effect frequencies')
+        self._populate_checkpointed(
+            'Frequencies', Frequency, frequency_df, self._make_frequency, checkpoint_size,
+        )
+
+    def _make_meddra_term(self, cui, meddra_id, kind, name) -> MeddraTerm:
+        return MeddraTerm(
+            cui=cui,
+            meddra_id=meddra_id,
+            name=name,
+            meddra_type=self.get_or_create_meddra_type(kind),
+        )
 
-    def _populate_meddra(self, url: Optional[str] = None):
+    def _populate_meddra(self, url: Optional[str] = None, checkpoint_size: Optional[int] = None):
         """Populate the MedDRA terms in the database.
 
         From http://sideeffects.embl.de/media/download/README, this file should have the following columns:
@@ -210,21 +623,36 @@ class Manager(AbstractManager, BELManagerMixin, FlaskMixin):
         4. name of side effect
 
         :param url: The URL for the meddra.tsv file
+        :param checkpoint_size: The number of rows to commit at once
         """
         log.info('getting MedDRA data')
         df = get_meddra_df(url=url)
+        self._populate_checkpointed('MedDRA', MeddraTerm, df, self._make_meddra_term, checkpoint_size)
 
-        for row in tqdm(df.iterrows(), total=len(df.index)):
-            pass
+    def populate(
+            self,
+            side_effects_url: Optional[str] = None,
+            indications_url: Optional[str] = None,
+            frequencies_url: Optional[str] = None,
+            meddra_url: Optional[str] = None,
+            checkpoint_size: Optional[int] = None,
+    ):
+        """Populate the side effects, indications, side effect frequencies, and MedDRA terms from SIDER.
 
-    def populate(self, side_effects_url: Optional[str] = None, indications_url: Optional[str] = None):
-        """Populate the side effects and indications from SIDER.
+        Rows are committed in batches of ``checkpoint_size``. If a previous run was interrupted, this continues from
+        its last checkpoint.
 
         :param side_effects_url:
         :param indications_url:
+        :param frequencies_url:
+        :param meddra_url:
+        :param checkpoint_size: The number of rows to commit at once
         """
-        self._populate_indications(url=indications_url)
-        self._populate_side_effects(url=side_effects_url)
+        with self._keep_population_models():
+            self._populate_indications(url=indications_url, checkpoint_size=checkpoint_size)
+            self._populate_side_effects(url=side_effects_url, checkpoint_size=checkpoint_size)
+            self._populate_frequencies(url=frequencies_url, checkpoint_size=checkpoint_size)
+            self._populate_meddra(url=meddra_url, checkpoint_size=checkpoint_size)
 
     def to_bel(self) -> BELGraph:
         """Serialize SIDER to BEL."""
@@ -242,3 +670,51 @@ class Manager(AbstractManager, BELManagerMixin, FlaskMixin):
             indication.add_to_bel_graph(graph)
 
         return graph
+
+    def export_edges(self, path: str, fmt: Optional[str] = None, chunk_size: Optional[int] = None) -> int:
+        """Write the side effects and indications to a Parquet or Arrow IPC file.
+
+        This streams rows straight out of the database, so it is much faster than taking apart :meth:`to_bel`.
+        See :func:`bio2bel_sider.export.export_edges`.
+
+        :return: The number of rows written
+        """
+        return export_edges(self, path, fmt=fmt, chunk_size=chunk_size)
+
+    def resolve(
+            self,
+            identifiers: Iterable[str],
+            default_namespace: str = 'pubchem',
+            chunk_size: Optional[int] = None,
+    ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """Resolve PubChem, STITCH, UMLS, and MedDRA identifiers to compounds and UMLS concepts in bulk.
+
+        See :func:`bio2bel_sider.resolve.resolve_identifiers`.
+
+        :return: A data frame of the resolved identifiers and one of the identifiers that could not be resolved
+        """
+        return resolve_identifiers(self, identifiers, default_namespace=default_namespace, chunk_size=chunk_size)
+
+    @staticmethod
+    def _cli_add_export(main: click.Group) -> click.Group:
+        """Add the export command."""
+        return add_cli_export(main)
+
+    @staticmethod
+    def _cli_add_download(main: click.Group) -> click.Group:
+        """Add the download command."""
+        return add_cli_download(main)
+
+    @staticmethod
+    def _cli_add_resolve(main: click.Group) -> click.Group:
+        """Add the resolve command."""
+        return add_cli_resolve(main)
+
+    @classmethod
+    def get_cli(cls) -> click.Group:
+        """Get a :mod:`click` main function with the SIDER-specific commands."""
+        main = super().get_cli()
+        cls._cli_add_download(main)
+        cls._cli_add_export(main)
+        cls._cli_add_resolve(main)
+        return main
@@ -2,7 +2,7 @@
 
 """SQLAlchemy models for Bio2BEL SIDER."""
 
-from sqlalchemy import Column, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, Column, Float, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import backref, relationship
 
@@ -11,11 +11,16 @@ from pybel import BELGraph
 from .constants import MODULE_NAME
 
 COMPOUND_TABLE_NAME = f'{MODULE_NAME}_compound'
+STEREOISOMER_TABLE_NAME = f'{MODULE_NAME}_stereoisomer'
 UMLS_TABLE_NAME = f'{MODULE_NAME}_umls'
 MEDDRA_TYPE_TABLE_NAME = f'{MODULE_NAME}_meddratype'
 DETECTION_TABLE_NAME = f'{MODULE_NAME}_detection'
+MEDDRA_TERM_TABLE_NAME = f'{MODULE_NAME}_meddraterm'
 COMPOUND_SIDE_EFFECT_TABLE_NAME = f'{MODULE_NAME}_sideeffect'
 COMPOUND_INDICATION_TABLE_NAME = f'{MODULE_NAME}_indication'
+COMPOUND_FREQUENCY_TABLE_NAME = f'{MODULE_NAME}_frequency'
+STATISTIC_TABLE_NAME = f'{MODULE_NAME}_statistic'
+CHECKPOINT_TABLE_NAME = f'{MODULE_NAME}_checkpoint'
 
 Base = declarative_base()
 
@@ -30,6 +35,11 @@ class Compound(Base):
     stitch_id = Column(String(255), nullable=False, index=True)
     inchi_key = Column(Text, nullable=True, doc='InChI Key for this compound')
 
+    side_effect_count = Column(Integer, nullable=False, default=0, index=True,
+                               doc='Precomputed number of distinct side effects of this compound')
+    indication_count = Column(Integer, nullable=False, default=0, index=True,
+                              doc='Precomputed number of distinct indications of this compound')
+
     #: Identifier of the flat parent, if this is a stereo entry
     parent_id = Column(Integer, ForeignKey(f'{COMPOUND_TABLE_NAME}.id'), nullable=True)
     children = relationship('Compound', backref=backref('parent', remote_side=[id]))
@@ -45,6 +55,22 @@ class Compound(Base):
         )
 
 
+class Stereoisomer(Base):
+    """Represents a STITCH stereo compound and the flat compound it is listed under in SIDER."""
+
+    __tablename__ = STEREOISOMER_TABLE_NAME
+    id = Column(Integer, primary_key=True)
+
+    stitch_id = Column(String(255), nullable=False, index=True)
+    pubchem_id = Column(String(255), nullable=False, index=True)
+
+    compound_id = Column(Integer, ForeignKey(f'{COMPOUND_TABLE_NAME}.id'), nullable=False, index=True)
+    compound = relationship(Compound, backref=backref('stereoisomers', lazy='dynamic'))
+
+    def __repr__(self):  # noqa: D105
+        return f'pubchem.compound:{self.pubchem_id}'
+
+
 class Umls(Base):
     """Represents a UMLS entry."""
 
@@ -54,6 +80,11 @@ class Umls(Base):
     cui = Column(String(255), nullable=False, index=True)
     name = Column(String(255), nullable=False, index=True)
 
+    side_effect_compound_count = Column(Integer, nullable=False, default=0, index=True,
+                                        doc='Precomputed number of distinct compounds with this side effect')
+    indication_compound_count = Column(Integer, nullable=False, default=0, index=True,
+                                       doc='Precomputed number of distinct compounds with this indication')
+
     def __repr__(self):  # noqa: D105
         return self.name
 
@@ -90,16 +121,33 @@ class Detection(Base):
         return self.name
 
 
+class MeddraTerm(Base):
+    """Represents a MedDRA term and the UMLS concept it maps to."""
+
+    __tablename__ = MEDDRA_TERM_TABLE_NAME
+    id = Column(Integer, primary_key=True)
+
+    meddra_id = Column(String(255), nullable=False, index=True)
+    cui = Column(String(255), nullable=False, index=True, doc='The UMLS CUI, which may not have any SIDER entries')
+    name = Column(String(255), nullable=False)
+
+    meddra_type_id = Column(Integer, ForeignKey(f'{MEDDRA_TYPE_TABLE_NAME}.id'), nullable=False)
+    meddra_type = relationship(MeddraType)
+
+    def __repr__(self):  # noqa: D105
+        return self.name
+
+
 class SideEffect(Base):
     """Represents a side effect of a compound."""
 
     __tablename__ = COMPOUND_SIDE_EFFECT_TABLE_NAME
     id = Column(Integer, primary_key=True)
 
-    compound_id = Column(Integer, ForeignKey(f'{COMPOUND_TABLE_NAME}.id'), nullable=False)
+    compound_id = Column(Integer, ForeignKey(f'{COMPOUND_TABLE_NAME}.id'), nullable=False, index=True)
     compound = relationship(Compound, backref=backref('side_effects', lazy='dynamic'))
 
-    umls_id = Column(Integer, ForeignKey(f'{UMLS_TABLE_NAME}.id'), nullable=False)
+    umls_id = Column(Integer, ForeignKey(f'{UMLS_TABLE_NAME}.id'), nullable=False, index=True)
     umls = relationship(Umls, backref=backref('side_effects', lazy='dynamic'))
 
     meddra_type_id = Column(Integer, ForeignKey(f'{MEDDRA_TYPE_TABLE_NAME}.id'), nullable=False)
@@ -125,10 +173,10 @@ class Indication(Base):
     __tablename__ = COMPOUND_INDICATION_TABLE_NAME
     id = Column(Integer, primary_key=True)
 
-    compound_id = Column(Integer, ForeignKey(f'{COMPOUND_TABLE_NAME}.id'), nullable=False)
+    compound_id = Column(Integer, ForeignKey(f'{COMPOUND_TABLE_NAME}.id'), nullable=False, index=True)
     compound = relationship(Compound, backref=backref('indications', lazy='dynamic'))
 
-    umls_id = Column(Integer, ForeignKey(f'{UMLS_TABLE_NAME}.id'), nullable=False)
+    umls_id = Column(Integer, ForeignKey(f'{UMLS_TABLE_NAME}.id'), nullable=False, index=True)
     umls = relationship(Umls, backref=backref('indications', lazy='dynamic'))
 
     meddra_type_id = Column(Integer, ForeignKey(f'{MEDDRA_TYPE_TABLE_NAME}.id'), nullable=False)
@@ -150,3 +198,67 @@ class Indication(Base):
                 'SIDER_DETECTION': self.detection.name,
             }
         )
+
+
+class Frequency(Base):
+    """Represents how often a side effect of a compound occurs, as reported on a drug label."""
+
+    __tablename__ = COMPOUND_FREQUENCY_TABLE_NAME
+    id = Column(Integer, primary_key=True)
+
+    compound_id = Column(Integer, ForeignKey(f'{COMPOUND_TABLE_NAME}.id'), nullable=False)
+    compound = relationship(Compound, backref=backref('frequencies', lazy='dynamic'))
+
+    umls_id = Column(Integer, ForeignKey(f'{UMLS_TABLE_NAME}.id'), nullable=False)
+    umls = relationship(Umls, backref=backref('frequencies', lazy='dynamic'))
+
+    meddra_type_id = Column(Integer, ForeignKey(f'{MEDDRA_TYPE_TABLE_NAME}.id'), nullable=False)
+    meddra_type = relationship(MeddraType)
+
+    placebo = Column(Boolean, nullable=False, default=False, doc='Whether this frequency was observed with placebo')
+    description = Column(String(255), nullable=True, doc='The frequency as written on the label, e.g., 1-5% or rare')
+    lower_bound = Column(Float, nullable=True, doc='The lower bound of the frequency, between 0 and 1')
+    upper_bound = Column(Float, nullable=True, doc='The upper bound of the frequency, between 0 and 1')
+
+    __table_args__ = (
+        Index(f'ix_{COMPOUND_FREQUENCY_TABLE_NAME}_umls_lower', umls_id, lower_bound),
+        Index(f'ix_{COMPOUND_FREQUENCY_TABLE_NAME}_umls_upper', umls_id, upper_bound),
+        Index(f'ix_{COMPOUND_FREQUENCY_TABLE_NAME}_compound_lower', compound_id, lower_bound),
+        Index(f'ix_{COMPOUND_FREQUENCY_TABLE_NAME}_compound_upper', compound_id, upper_bound),
+    )
+
+    def __repr__(self):  # noqa: D105
+        return f'{self.compound} {self.umls} {self.description}'
+
+
+class Statistic(Base):
+    """Represents a precomputed count over the whole database, used for constant-time summaries."""
+
+    __tablename__ = STATISTIC_TABLE_NAME
+    id = Column(Integer, primary_key=True)
+
+    name = Column(String(255), nullable=False, unique=True, index=True)
+    count = Column(Integer, nullable=False)
+
+    def __repr__(self):  # noqa: D105
+        return f'{self.name}: {self.count}'
+
+
+class Checkpoint(Base):
+    """Represents how far population from a source file got, so an interrupted run can resume."""
+
+    __tablename__ = CHECKPOINT_TABLE_NAME
+    id = Column(Integer, primary_key=True)
+
+    source = Column(String(255), nullable=False, unique=True, index=True)
+    fingerprint = Column(String(64), nullable=False, doc='SHA-256 of the parsed rows of the source file')
+    row_offset = Column(Integer, nullable=False, default=0, doc='Number of rows committed so far')
+    row_total = Column(Integer, nullable=False, doc='Number of rows in the source file')
+
+    @property
+    def complete(self) -> bool:
+        """Check if all rows of the source file were committed."""
+        return self.row_offset == self.row_total
+
+    def __repr__(self):  # noqa: D105
+        return f'{self.source}: {self.row_offset}/{self.row_total}'
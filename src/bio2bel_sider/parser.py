@@ -1,10 +1,19 @@
 # -*- coding: utf-8 -*-
 
-"""Getters for MedDRA data."""
+"""Getters for MedDRA data.
 
-from bio2bel import make_df_getter
+Each getter takes an optional ``usecols`` argument so callers only parse the columns they need. Repeated identifiers
+and low-cardinality fields are parsed as :class:`pandas.CategoricalDtype` and the frequency bounds as floats, which
+keeps the full SIDER files small in memory.
+"""
+
+from typing import Callable, Iterable, Mapping, Optional
+
+import pandas as pd
+
+from bio2bel import make_downloader
 from bio2bel_sider.constants import (
-    DRUG_NAMES_HEADER, DRUG_NAMES_PATH, DRUG_NAMES_URL, FREQUENCY_HEADER, FREQUENCY_PATH, FREQUENCY_URL, 
+    DRUG_NAMES_HEADER, DRUG_NAMES_PATH, DRUG_NAMES_URL, FREQUENCY_HEADER, FREQUENCY_PATH, FREQUENCY_URL,
     INDICATIONS_HEADER, INDICATIONS_PATH, INDICATIONS_URL, MEDDRA_HEADER, MEDDRA_PATH, MEDDRA_URL,
     SIDE_EFFECTS_HEADER, SIDE_EFFECTS_PATH, SIDE_EFFECTS_URL,
 )
@@ -14,39 +23,128 @@ __all__ = [
     'get_drug_names_df',
     'get_meddra_df',
     'get_side_effects_df',
+    'get_se_frequency_df',
 ]
 
-get_indications_df = make_df_getter(
+DfGetter = Callable[..., pd.DataFrame]
+
+INDICATIONS_DTYPE = {
+    'STITCH_FLAT_ID': 'category',
+    'UMLS CUI from Label': 'category',
+    'Method of Detection': 'category',
+    'Concept Name': 'category',
+    'MedDRA Concept Type': 'category',
+    'UMLS CUI from MedDRA': 'category',
+    'MedDRA Concept name': 'category',
+}
+
+DRUG_NAMES_DTYPE = {
+    'STITCH_FLAT_ID': str,
+    'Drug Name': str,
+}
+
+MEDDRA_DTYPE = {
+    'UMLS_ID': str,
+    'MedDRA_ID': str,
+    'Kind': 'category',
+    'Name': str,
+}
+
+SIDE_EFFECTS_DTYPE = {
+    'STITCH_FLAT_ID': 'category',
+    'STITCH_STEREO_ID': 'category',
+    'UMLS CUI from Label': 'category',
+    'MedDRA Concept Type': 'category',
+    'UMLS CUI from MedDRA': 'category',
+    'MedDRA Concept name': 'category',
+}
+
+FREQUENCY_DTYPE = {
+    'STITCH_FLAT_ID': 'category',
+    'STITCH_STEREO_ID': 'category',
+    'UMLS CUI from Label': 'category',
+    'Type of effect': 'category',
+    'Frequency description': 'category',
+    'Frequency lower bound': 'float64',
+    'Frequency upper bound': 'float64',
+    'MedDRA Concept Type': 'category',
+    'UMLS CUI from MedDRA': 'category',
+    'MedDRA Concept name': 'category',
+}
+
+
+def _make_typed_df_getter(data_url: str, data_path: str, names: Iterable[str], dtype: Mapping[str, str]) -> DfGetter:
+    """Build a function that downloads a headerless SIDER TSV and parses it with the given column types.
+
+    :param data_url: The URL of the data
+    :param data_path: The path where the data should get stored
+    :param names: The names of all columns in the file
+    :param dtype: A mapping from column names to the :mod:`pandas` types used to parse them
+    """
+    download_function = make_downloader(data_url, data_path)
+    names = list(names)
+
+    def get_df(
+            url: Optional[str] = None,
+            cache: bool = True,
+            force_download: bool = False,
+            usecols: Optional[Iterable[str]] = None,
+    ) -> pd.DataFrame:
+        """Get the data as a pandas DataFrame.
+
+        :param url: The URL (or file path) to download.
+        :param cache: If true, the data is downloaded to the file system, else it is loaded from the internet
+        :param force_download: If true, overwrites a previously cached file
+        :param usecols: The subset of columns to parse. Defaults to all columns.
+        """
+        if url is None and cache:
+            url = download_function(force_download=force_download)
+
+        columns = names if usecols is None else list(usecols)
+
+        return pd.read_csv(
+            url or data_url,
+            sep='\t',
+            header=None,
+            names=names,
+            usecols=columns,
+            dtype={column: dtype[column] for column in columns if column in dtype},
+        )
+
+    return get_df
+
+
+get_indications_df = _make_typed_df_getter(
     INDICATIONS_URL,
     INDICATIONS_PATH,
-    sep='\t',
     names=INDICATIONS_HEADER,
+    dtype=INDICATIONS_DTYPE,
 )
 
-get_drug_names_df = make_df_getter(
+get_drug_names_df = _make_typed_df_getter(
     DRUG_NAMES_URL,
     DRUG_NAMES_PATH,
-    sep='\t',
     names=DRUG_NAMES_HEADER,
+    dtype=DRUG_NAMES_DTYPE,
 )
 
-get_meddra_df = make_df_getter(
+get_meddra_df = _make_typed_df_getter(
     MEDDRA_URL,
     MEDDRA_PATH,
-    sep='\t',
     names=MEDDRA_HEADER,
+    dtype=MEDDRA_DTYPE,
 )
 
-get_side_effects_df = make_df_getter(
+get_side_effects_df = _make_typed_df_getter(
     SIDE_EFFECTS_URL,
     SIDE_EFFECTS_PATH,
-    sep='\t',
     names=SIDE_EFFECTS_HEADER,
+    dtype=SIDE_EFFECTS_DTYPE,
 )
 
-get_se_frequency_df = make_df_getter(
+get_se_frequency_df = _make_typed_df_getter(
     FREQUENCY_URL,
     FREQUENCY_PATH,
-    sep='\t',
     names=FREQUENCY_HEADER,
+    dtype=FREQUENCY_DTYPE,
 )
@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+
+"""Resolve large lists of external identifiers to SIDER compounds and UMLS concepts.
+
+Identifiers are normalized with vectorized :mod:`pandas` string operations, then looked up with one ``IN`` query per
+chunk of distinct keys:
+
+- STITCH flat identifiers (``CID1...``) and PubChem compound identifiers (either bare, or prefixed like
+  ``pubchem.compound:85``, ``pubchem:85``, or ``CID:85``) are resolved to compounds by PubChem identifier
+- STITCH stereo identifiers (``CID0...``) are resolved to the flat compounds they are listed under in the side effects
+- UMLS CUIs (``C0000737`` or ``umls:C0000737``) are resolved to UMLS concepts
+- MedDRA identifiers (``meddra:10000081``) are resolved to UMLS concepts through the MedDRA terms
+
+Bare numbers are ambiguous between PubChem and MedDRA, so their namespace is given by ``default_namespace``.
+"""
+
+import logging
+import os
+import time
+from typing import Iterable, List, Optional, Tuple
+
+import click
+import pandas as pd
+
+from .models import Compound, MeddraTerm, Stereoisomer, Umls
+
+__all__ = [
+    'RESOLVED_COLUMNS',
+    'UNRESOLVED_COLUMNS',
+    'normalize_identifiers',
+    'resolve_identifiers',
+    'add_cli_resolve',
+]
+
+log = logging.getLogger(__name__)
+
+PUBCHEM = 'pubchem'
+STITCH_FLAT = 'stitch_flat'
+STITCH_STEREO = 'stitch_stereo'
+UMLS = 'umls'
+MEDDRA = 'meddra'
+
+COMPOUND_NAMESPACES = {PUBCHEM, STITCH_FLAT, STITCH_STEREO}
+
+#: Patterns applied in order to the stripped, upper-cased identifiers. The group captures the key to look up.
+PATTERNS = [
+    (STITCH_FLAT, r'^CID1(\d{8})$'),
+    (STITCH_STEREO, r'^CID0(\d{8})$'),
+    (UMLS, r'^(?:UMLS:)?(C\d{7})$'),
+    (MEDDRA, r'^MEDDRA:(\d+)$'),
+    (PUBCHEM, r'^(?:PUBCHEM(?:\.COMPOUND)?:|CID:?)(\d+)$'),
+]
+
+RESOLVED_COLUMNS = ['identifier', 'namespace', 'entity', 'stitch_id', 'pubchem_id', 'cui', 'name']
+UNRESOLVED_COLUMNS = ['identifier', 'namespace']
+
+#: The number of keys per ``IN`` query, which stays below SQLite's limit on the number of bound parameters
+DEFAULT_CHUNK_SIZE = 500
+
+
+def normalize_identifiers(identifiers: Iterable[str], default_namespace: str = PUBCHEM) -> pd.DataFrame:
+    """Detect the namespace of each identifier and normalize it to the key used for lookup.
+
+    Compound identifiers are normalized to PubChem compound identifiers.
+
+    :param identifiers: Identifiers from any of the supported namespaces
+    :param default_namespace: The namespace of bare numbers, either ``pubchem`` or ``meddra``
+    :return: A data frame with columns for the identifier, its namespace, and its key. Both are missing for
+     identifiers that could not be recognized.
+    """
+    if default_namespace not in {PUBCHEM, MEDDRA}:
+        raise ValueError(f'invalid default namespace: {default_namespace}')
+
+    identifiers = pd.Series(list(identifiers), dtype=object).astype(str)
+    cleaned = identifiers.str.strip().str.upper()
+
+    namespace = pd.Series(None, index=identifiers.index, dtype=object)
+    key = pd.Series(None, index=identifiers.index, dtype=object)
+
+    for name, pattern in PATTERNS + [(default_namespace, r'^(\d+)$')]:
+        extracted = cleaned.str.extract(pattern, expand=False)
+        mask = namespace.isna() & extracted.notna()
+        namespace[mask] = name
+        key[mask] = extracted[mask]
+
+    # STITCH identifiers encode the PubChem identifier, offset by 100000000 for flat compounds. The leading zeros are
+    # stripped as strings, since numbers too long for an integer type should end up unresolved rather than raise
+    mask = namespace.isin(COMPOUND_NAMESPACES)
+    stripped = key[mask].str.lstrip('0')
+    key[mask] = stripped.where(stripped != '', '0')
+
+    return pd.DataFrame({
+        'identifier': identifiers,
+        'namespace': namespace,
+        'key': key,
+    })
+
+
+def _query_chunked(query, column, keys: List[str], names: List[str], chunk_size: int) -> pd.DataFrame:
+    """Run the query once for each chunk of keys, filtering the column on each chunk."""
+    rows = []
+    for start in range(0, len(keys), chunk_size):
+        rows.extend(query.filter(column.in_(keys[start:start + chunk_size])).all())
+    return pd.DataFrame(rows, columns=names).drop_duplicates('key')
+
+
+def _get_keys(df: pd.DataFrame, namespaces) -> List[str]:
+    return df.loc[df['namespace'].isin(namespaces), 'key'].unique().tolist()
+
+
+def resolve_identifiers(
+        manager,
+        identifiers: Iterable[str],
+        default_namespace: str = PUBCHEM,
+        chunk_size: Optional[int] = None,
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Resolve identifiers to the compounds and UMLS concepts in the database.
+
+    :param manager: A SIDER manager
+    :param identifiers: Identifiers from any of the supported namespaces
+    :param default_namespace: The namespace of bare numbers, either ``pubchem`` or ``meddra``
+    :param chunk_size: The number of keys per query
+    :return: A data frame of the resolved identifiers with :data:`RESOLVED_COLUMNS` and one of the identifiers that
+     could not be resolved with :data:`UNRESOLVED_COLUMNS`, both in the order of the input
+    """
+    t = time.time()
+    chunk_size = chunk_size or DEFAULT_CHUNK_SIZE
+    df = normalize_identifiers(identifiers, default_namespace=default_namespace)
+
+    compounds = _query_chunked(
+        manager.session.query(Compound.pubchem_id, Compound.stitch_id),
+        Compound.pubchem_id,
+        _get_keys(df, {PUBCHEM, STITCH_FLAT}),
+        ['key', 'stitch_id'],
+        chunk_size,
+    )
+    compounds['pubchem_id'] = compounds['key']
+
+    stereoisomers = _query_chunked(
+        manager.session.query(Stereoisomer.pubchem_id, Compound.stitch_id, Compound.pubchem_id).join(Compound),
+        Stereoisomer.pubchem_id,
+        _get_keys(df, {STITCH_STEREO}),
+        ['key', 'stitch_id', 'pubchem_id'],
+        chunk_size,
+    )
+
+    umls = _query_chunked(
+        manager.session.query(Umls.cui, Umls.name),
+        Umls.cui,
+        _get_keys(df, {UMLS}),
+        ['key', 'name'],
+        chunk_size,
+    )
+    umls['cui'] = umls['key']
+
+    meddra = _query_chunked(
+        manager.session.query(MeddraTerm.meddra_id, Umls.cui, Umls.name).join(Umls, MeddraTerm.cui == Umls.cui),
+        MeddraTerm.meddra_id,
+        _get_keys(df, {MEDDRA}),
+        ['key', 'cui', 'name'],
+        chunk_size,
+    )
+
+    resolved = pd.concat(
+        [
+            df[df['namespace'].isin({PUBCHEM, STITCH_FLAT})].reset_index().merge(
+                compounds.assign(entity='compound'), on='key',
+            ),
+            df[df['namespace'] == STITCH_STEREO].reset_index().merge(
+                stereoisomers.assign(entity='compound'), on='key',
+            ),
+            df[df['namespace'] == UMLS].reset_index().merge(umls.assign(entity='umls'), on='key'),
+            df[df['namespace'] == MEDDRA].reset_index().merge(meddra.assign(entity='umls'), on='key'),
+        ],
+        sort=False,
+    ).set_index('index').sort_index()
+
+    unresolved = df.loc[~df.index.isin(resolved.index), UNRESOLVED_COLUMNS]
+    resolved = resolved.reindex(columns=RESOLVED_COLUMNS).reset_index(drop=True)
+
+    log.info('resolved %d of %d identifiers in %.2f seconds', len(resolved.index), len(df.index), time.time() - t)
+    return resolved, unresolved.reset_index(drop=True)
+
+
+def add_cli_resolve(main: click.Group) -> click.Group:  # noqa: D202
+    """Add a ``resolve`` command to main :mod:`click` function."""
+
+    @main.command()
+    @click.option('-i', '--input', 'input_path', type=click.Path(exists=True, dir_okay=False), required=True,
+                  help='A file with one identifier per line')
+    @click.option('-o', '--output', type=click.Path(dir_okay=False), required=True,
+                  help='Output TSV of resolved identifiers')
+    @click.option('-u', '--unresolved', type=click.Path(dir_okay=False),
+                  help='Output TSV of unresolved identifiers. Defaults to the output with .unresolved.tsv')
+    @click.option('-n', '--namespace', type=click.Choice([PUBCHEM, MEDDRA]), default=PUBCHEM, show_default=True,
+                  help='The namespace of bare numeric identifiers')
+    @click.pass_obj
+    def resolve(manager, input_path, output, unresolved, namespace):
+        """Resolve a file of PubChem, STITCH, UMLS, and MedDRA identifiers."""
+        identifiers = pd.read_csv(input_path, sep='\t', header=None, names=['identifier'], dtype=str)['identifier']
+        resolved_df, unresolved_df = resolve_identifiers(manager, identifiers, default_namespace=namespace)
+
+        if unresolved is None:
+            unresolved = f'{os.path.splitext(output)[0]}.unresolved.tsv'
+
+        resolved_df.to_csv(output, sep='\t', index=False)
+        unresolved_df.to_csv(unresolved, sep='\t', index=False)
+        click.echo(f'Resolved {len(resolved_df.index)} identifiers to {output}')
+        click.echo(f'Could not resolve {len(unresolved_df.index)} identifiers. Wrote to {unresolved}')
+
+    return main
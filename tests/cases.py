@@ -8,8 +8,10 @@ from bio2bel.testing import AbstractTemporaryCacheClassMixin
 from bio2bel_sider import Manager
 
 HERE = os.path.abspath(os.path.dirname(__file__))
-TEST_SIDE_EFFECTS_PATH = os.path.join(HERE, 'test_meddra_all_indications.tsv')
-TEST_INDICATIONS_PATH = os.path.join(HERE, 'test_meddra_all_se.tsv')
+TEST_SIDE_EFFECTS_PATH = os.path.join(HERE, 'test_meddra_all_se.tsv')
+TEST_INDICATIONS_PATH = os.path.join(HERE, 'test_meddra_all_indications.tsv')
+TEST_FREQUENCIES_PATH = os.path.join(HERE, 'test_meddra_freq.tsv')
+TEST_MEDDRA_PATH = os.path.join(HERE, 'test_meddra.tsv')
 
 
 class TemporaryCacheClassMixin(AbstractTemporaryCacheClassMixin):
@@ -23,4 +25,6 @@ class TemporaryCacheClassMixin(AbstractTemporaryCacheClassMixin):
         cls.manager.populate(
             side_effects_url=TEST_SIDE_EFFECTS_PATH,
             indications_url=TEST_INDICATIONS_PATH,
+            frequencies_url=TEST_FREQUENCIES_PATH,
+            meddra_url=TEST_MEDDRA_PATH,
         )
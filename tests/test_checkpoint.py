@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for resuming an interrupted population of Bio2BEL SIDER."""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from click.testing import CliRunner
+from sqlalchemy import event
+
+from bio2bel_sider import Manager
+from bio2bel_sider.models import Checkpoint, Statistic
+from bio2bel_sider.parser import get_indications_df, get_meddra_df, get_se_frequency_df, get_side_effects_df
+from bio2bel_sider.utils import convert_flat_stitch_id_to_pubchem_cid
+from tests.cases import TEST_FREQUENCIES_PATH, TEST_INDICATIONS_PATH, TEST_MEDDRA_PATH, TEST_SIDE_EFFECTS_PATH
+
+
+class CrashError(Exception):
+    """Stands in for a crash partway through population."""
+
+
+def _crash_after(n: int):
+    calls = 0
+
+    def convert(stitch_id: str) -> str:
+        nonlocal calls
+        calls += 1
+        if calls > n:
+            raise CrashError
+        return convert_flat_stitch_id_to_pubchem_cid(stitch_id)
+
+    return convert
+
+
+def _use_test_files():
+    """Patch the getters used by populate to read the test files instead of downloading SIDER."""
+    return mock.patch.multiple(
+        'bio2bel_sider.manager',
+        get_indications_df=lambda url, **kwargs: get_indications_df(url=TEST_INDICATIONS_PATH, **kwargs),
+        get_side_effects_df=lambda url, **kwargs: get_side_effects_df(url=TEST_SIDE_EFFECTS_PATH, **kwargs),
+        get_se_frequency_df=lambda url, **kwargs: get_se_frequency_df(url=TEST_FREQUENCIES_PATH, **kwargs),
+        get_meddra_df=lambda url, **kwargs: get_meddra_df(url=TEST_MEDDRA_PATH, **kwargs),
+        DEFAULT_CHECKPOINT_SIZE=3,
+    )
+
+
+class TestCheckpoint(unittest.TestCase):
+    """Test that population continues from the last checkpoint."""
+
+    def setUp(self):
+        """Make a temporary SQLite database."""
+        self.fd, self.path = tempfile.mkstemp()
+        self.connection = f'sqlite:///{self.path}'
+
+    def tearDown(self):
+        """Remove the temporary database."""
+        os.close(self.fd)
+        os.remove(self.path)
+
+    def _get_checkpoints(self, manager: Manager):
+        return {
+            checkpoint.source: checkpoint.row_offset
+            for checkpoint in manager.session.query(Checkpoint)
+        }
+
+    def test_resume(self):
+        """Test a run interrupted partway through the side effects is finished by the next run."""
+        manager = Manager(connection=self.connection)
+        # all 10 indications, then 7 of the side effects, of which the first 6 are committed
+        with mock.patch('bio2bel_sider.manager.convert_flat_stitch_id_to_pubchem_cid', _crash_after(17)):
+            with self.assertRaises(CrashError):
+                manager._populate_indications(url=TEST_INDICATIONS_PATH, checkpoint_size=3)
+                manager._populate_side_effects(url=TEST_SIDE_EFFECTS_PATH, checkpoint_size=3)
+
+        self.assertEqual(10, manager.count_indications())
+        self.assertEqual(6, manager.count_side_effects())
+        self.assertEqual({'Indications': 10, 'Side Effects': 6}, self._get_checkpoints(manager))
+        manager.session.close()
+
+        manager = Manager(connection=self.connection)
+        with mock.patch('bio2bel_sider.manager.convert_flat_stitch_id_to_pubchem_cid') as convert:
+            convert.side_effect = convert_flat_stitch_id_to_pubchem_cid
+            manager.populate(
+                side_effects_url=TEST_SIDE_EFFECTS_PATH,
+                indications_url=TEST_INDICATIONS_PATH,
+                frequencies_url=TEST_FREQUENCIES_PATH,
+                meddra_url=TEST_MEDDRA_PATH,
+                checkpoint_size=3,
+            )
+            self.assertEqual(4 + 8, convert.call_count, msg='only the remaining side effects should be loaded')
+
+        self.assertEqual(10, manager.count_indications())
+        self.assertEqual(10, manager.count_side_effects())
+        self.assertEqual(1, manager.count_compounds())
+        self.assertEqual(
+            {'Indications': 10, 'Side Effects': 10, 'Frequencies': 8, 'MedDRA': 6},
+            self._get_checkpoints(manager),
+        )
+
+    def test_lookups_across_checkpoints(self):
+        """Test each compound and UMLS is queried once, even though the models are used again after each commit."""
+        manager = Manager(connection=self.connection)
+        statements = []
+        event.listen(manager.engine, 'before_cursor_execute', lambda *args: statements.append(args[2]))
+
+        manager._populate_side_effects(url=TEST_SIDE_EFFECTS_PATH, checkpoint_size=3)
+
+        def count_selects(table: str) -> int:
+            return sum(statement.startswith(f'SELECT {table}.id') for statement in statements)
+
+        compound_selects, umls_selects = count_selects('sider_compound'), count_selects('sider_umls')
+        self.assertEqual(1, compound_selects)
+        self.assertEqual(manager.count_umls(), umls_selects)
+        self.assertIsNone(manager._population_models)
+
+        # a cached model costs no round trip
+        with manager._keep_population_models():
+            compound = manager.get_or_create_compound('CID100000085')
+            manager.session.commit()
+            del statements[:]
+            self.assertIs(compound, manager.get_or_create_compound('CID100000085'))
+            self.assertEqual('85', compound.pubchem_id)
+        self.assertEqual([], statements)
+
+    def test_changed_source(self):
+        """Test a source that changed since the last run is loaded from scratch."""
+        manager = Manager(connection=self.connection)
+        manager._populate_side_effects(url=TEST_SIDE_EFFECTS_PATH)
+        self.assertEqual(10, manager.count_side_effects())
+
+        # pretend the file changed since the last run, so the side effects get replaced instead of added to
+        checkpoint = manager.session.query(Checkpoint).filter(Checkpoint.source == 'Side Effects').one()
+        checkpoint.fingerprint = 'outdated'
+        manager.session.commit()
+
+        manager._populate_side_effects(url=TEST_SIDE_EFFECTS_PATH)
+        self.assertEqual(10, manager.count_side_effects())
+
+    def test_changed_source_statistics(self):
+        """Test the precomputed counts match the committed rows after a changed source is interrupted and resumed."""
+        with _use_test_files():
+            manager = Manager(connection=self.connection)
+            manager.populate()
+        self.assertEqual(10, manager.summarize()['side_effects'])
+        self.assertEqual(6, manager.get_top_compounds()[0].side_effect_count)
+
+        checkpoint = manager.session.query(Checkpoint).filter(Checkpoint.source == 'Side Effects').one()
+        checkpoint.fingerprint = 'outdated'
+        manager.session.commit()
+
+        # the first 3 side effects, with 2 distinct UMLS, are committed before the crash
+        with mock.patch('bio2bel_sider.manager.convert_flat_stitch_id_to_pubchem_cid', _crash_after(4)):
+            with self.assertRaises(CrashError):
+                manager._populate_side_effects(url=TEST_SIDE_EFFECTS_PATH, checkpoint_size=3)
+        manager.session.expire_all()
+
+        statistic = manager.session.query(Statistic).filter(Statistic.name == 'side_effects').one()
+        self.assertEqual(3, statistic.count)
+        compound = manager.get_top_compounds()[0]
+        self.assertEqual(2, compound.side_effect_count)
+        self.assertEqual(5, compound.indication_count)
+        self.assertEqual(
+            {'C0000729', 'C0000737'},
+            {umls.cui for umls in manager.get_top_side_effects(n=20) if umls.side_effect_compound_count},
+        )
+
+        manager._populate_side_effects(url=TEST_SIDE_EFFECTS_PATH, checkpoint_size=3)
+        manager.session.expire_all()
+        self.assertEqual(10, manager.summarize()['side_effects'])
+        self.assertEqual(6, manager.get_top_compounds()[0].side_effect_count)
+
+    def test_resume_cli(self):
+        """Test running the populate command again after a crash continues instead of stopping."""
+        runner = CliRunner()
+        main = Manager.get_cli()
+
+        crash = mock.patch('bio2bel_sider.manager.convert_flat_stitch_id_to_pubchem_cid', _crash_after(5))
+        with _use_test_files(), crash:
+            runner.invoke(main, ['-c', self.connection, 'populate'])
+
+        manager = Manager(connection=self.connection)
+        self.assertEqual(3, manager.count_indications())
+        self.assertFalse(manager.is_populated())
+        manager.session.close()
+
+        with _use_test_files():
+            result = runner.invoke(main, ['-c', self.connection, 'populate'])
+        self.assertEqual(0, result.exit_code, msg=result.output)
+        self.assertNotIn('already populated', result.output)
+
+        manager = Manager(connection=self.connection)
+        self.assertTrue(manager.is_populated())
+        self.assertEqual(10, manager.count_indications())
+        self.assertEqual(10, manager.count_side_effects())
+        self.assertEqual(8, manager.count_frequencies())
+        self.assertEqual(6, manager.count_meddra_terms())
+        manager.session.close()
+
+        result = runner.invoke(main, ['-c', self.connection, 'populate'])
+        self.assertIn('already populated', result.output)
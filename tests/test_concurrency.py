@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for serving Bio2BEL SIDER from several threads."""
+
+import os
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from bio2bel_sider import Manager
+from bio2bel_sider.manager import ReadOnlySessionError
+from bio2bel_sider.models import Compound
+from tests.cases import TEST_FREQUENCIES_PATH, TEST_INDICATIONS_PATH, TEST_MEDDRA_PATH, TEST_SIDE_EFFECTS_PATH
+
+
+class TestConcurrentReads(unittest.TestCase):
+    """Test a manager built from a connection pool."""
+
+    def setUp(self):
+        """Populate a temporary SQLite database and build a read-only manager on it."""
+        self.fd, self.path = tempfile.mkstemp()
+        self.connection = f'sqlite:///{self.path}'
+
+        writer = Manager(connection=self.connection)
+        writer.populate(
+            side_effects_url=TEST_SIDE_EFFECTS_PATH,
+            indications_url=TEST_INDICATIONS_PATH,
+            frequencies_url=TEST_FREQUENCIES_PATH,
+            meddra_url=TEST_MEDDRA_PATH,
+        )
+        writer.session.close()
+
+        self.manager = Manager.from_connection_pool(connection=self.connection, pool_size=2, max_overflow=2)
+
+    def tearDown(self):
+        """Close the connections and remove the temporary database."""
+        self.manager.session.remove()
+        self.manager.engine.dispose()
+        os.close(self.fd)
+        os.remove(self.path)
+
+    def _lookup(self, _) -> int:
+        try:
+            compound = self.manager.get_compound_by_stitch_id('CID100000085')
+            return compound.side_effects.count()
+        finally:
+            self.manager.session.remove()
+
+    def test_threads(self):
+        """Test lookups from several threads get their own sessions."""
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            counts = list(executor.map(self._lookup, range(40)))
+
+        self.assertEqual([10] * 40, counts)
+
+    def test_cache_across_threads(self):
+        """Test a compound cached by another thread, whose session was since removed, is usable in this thread."""
+        def get_in_thread():
+            try:
+                return self.manager.get_or_create_compound('CID100000085').id
+            finally:
+                self.manager.session.remove()
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            compound_id = executor.submit(get_in_thread).result()
+
+        self.assertEqual({'CID100000085': compound_id}, self.manager.stitch_id_to_compound)
+        compound = self.manager.get_or_create_compound('CID100000085')
+        self.assertEqual(compound_id, compound.id)
+        self.assertEqual(10, compound.side_effects.count())
+
+    def test_read_only(self):
+        """Test that the pooled session refuses to write."""
+        self.manager.session.add(Compound(stitch_id='CID100000001', pubchem_id='1'))
+        with self.assertRaises(ReadOnlySessionError):
+            self.manager.session.flush()
+        self.manager.session.rollback()
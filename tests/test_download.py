@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for downloading the SIDER source files."""
+
+import gzip
+import hashlib
+import os
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from bio2bel_sider.download import DOWNLOADED, DownloadIntegrityError, NOT_MODIFIED, download_all, download_file
+
+LAST_MODIFIED = 'Wed, 21 Oct 2015 07:28:00 GMT'
+
+
+class Handler(BaseHTTPRequestHandler):
+    """Serves files from :data:`Handler.files` with ETags and range requests, and records the requests."""
+
+    #: Maps paths to their contents
+    files = {}
+    #: The headers of each request that was received
+    requests = []
+    #: If set, only this many bytes of the body are sent, to simulate a dropped connection
+    truncate = None
+
+    def do_GET(self):  # noqa: N802
+        """Serve a file, respecting conditional and range headers."""
+        self.requests.append(dict(self.headers))
+        content = self.files.get(self.path)
+        if content is None:
+            self.send_error(404)
+            return
+
+        etag = '"{}"'.format(hashlib.md5(content).hexdigest())
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        start = 0
+        range_header = self.headers.get('Range')
+        if range_header and self.headers.get('If-Range') in {etag, LAST_MODIFIED}:
+            start = int(range_header[len('bytes='):].rstrip('-'))
+            self.send_response(206)
+            self.send_header('Content-Range', f'bytes {start}-{len(content) - 1}/{len(content)}')
+        else:
+            self.send_response(200)
+
+        body = content[start:]
+        self.send_header('ETag', etag)
+        self.send_header('Last-Modified', LAST_MODIFIED)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body if self.truncate is None else body[:self.truncate])
+
+    def log_message(self, *args):  # noqa: D102
+        pass
+
+
+class TestDownload(unittest.TestCase):
+    """Test downloading against a local HTTP server."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Start the local HTTP server."""
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base_url = 'http://127.0.0.1:{}'.format(cls.server.server_address[1])
+
+    @classmethod
+    def tearDownClass(cls):
+        """Stop the local HTTP server."""
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        """Make a temporary cache directory and reset the served files."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.content = gzip.compress(b'CID100000085\tC0000729\tLLT\n' * 1000)
+        Handler.files = {'/meddra_all_se.tsv.gz': self.content, '/drug_names.tsv': b'CID100000085\tcarnitine\n'}
+        Handler.requests = []
+        Handler.truncate = None
+        self.url = f'{self.base_url}/meddra_all_se.tsv.gz'
+        self.path = os.path.join(self.directory.name, 'meddra_all_se.tsv.gz')
+
+    def tearDown(self):
+        """Remove the temporary cache directory."""
+        self.directory.cleanup()
+
+    def _read(self) -> bytes:
+        with open(self.path, 'rb') as file:
+            return file.read()
+
+    def test_conditional(self):
+        """Test an unchanged file is not downloaded again, but a changed one is."""
+        self.assertEqual(DOWNLOADED, download_file(self.url, self.path))
+        self.assertEqual(self.content, self._read())
+
+        self.assertEqual(NOT_MODIFIED, download_file(self.url, self.path))
+        self.assertIn('If-None-Match', Handler.requests[-1])
+
+        self.assertEqual(DOWNLOADED, download_file(self.url, self.path, force=True))
+
+        Handler.files['/meddra_all_se.tsv.gz'] = new_content = gzip.compress(b'changed\n')
+        self.assertEqual(DOWNLOADED, download_file(self.url, self.path))
+        self.assertEqual(new_content, self._read())
+
+    def test_modified_cached_copy(self):
+        """Test a cached copy that no longer matches its stored digest is downloaded again."""
+        download_file(self.url, self.path)
+        with open(self.path, 'wb') as file:
+            file.write(b'modified')
+
+        self.assertEqual(DOWNLOADED, download_file(self.url, self.path))
+        self.assertEqual(self.content, self._read())
+        self.assertNotIn('If-None-Match', Handler.requests[-1])
+
+    def test_stale_part(self):
+        """Test a partial download is removed when the server says the cached copy is up to date."""
+        download_file(self.url, self.path)
+
+        part_path = f'{self.path}.part'
+        with open(part_path, 'wb') as file:
+            file.write(self.content[:100])
+        with open(f'{part_path}.json', 'w') as file:
+            file.write('{"etag": "\\"outdated\\""}')
+
+        self.assertEqual(NOT_MODIFIED, download_file(self.url, self.path))
+        self.assertFalse(os.path.exists(part_path))
+        self.assertFalse(os.path.exists(f'{part_path}.json'))
+
+    def test_resume(self):
+        """Test an interrupted download is rejected, then resumed with a range request."""
+        Handler.truncate = 100
+        with self.assertRaises(DownloadIntegrityError):
+            download_file(self.url, self.path)
+        self.assertFalse(os.path.exists(self.path))
+
+        part_path = f'{self.path}.part'
+        self.assertEqual(100, os.path.getsize(part_path))
+
+        Handler.truncate = None
+        self.assertEqual(DOWNLOADED, download_file(self.url, self.path))
+        self.assertEqual('bytes=100-', Handler.requests[-1]['Range'])
+        self.assertEqual(self.content, self._read())
+        self.assertFalse(os.path.exists(part_path))
+
+    def test_corrupt(self):
+        """Test a corrupt gzip file does not replace the cached copy."""
+        download_file(self.url, self.path)
+
+        Handler.files['/meddra_all_se.tsv.gz'] = b'not gzipped'
+        with self.assertRaises(DownloadIntegrityError):
+            download_file(self.url, self.path)
+        self.assertEqual(self.content, self._read())
+
+    def test_download_all(self):
+        """Test downloading several files concurrently."""
+        sources = {
+            name: (f'{self.base_url}/{name}', os.path.join(self.directory.name, name))
+            for name in ('meddra_all_se.tsv.gz', 'drug_names.tsv')
+        }
+        self.assertEqual({name: DOWNLOADED for name in sources}, download_all(sources))
+        self.assertEqual({name: NOT_MODIFIED for name in sources}, download_all(sources))
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for exporting Bio2BEL SIDER as a flat edge list."""
+
+import os
+import tempfile
+from unittest import mock
+
+from bio2bel_sider import Manager
+from bio2bel_sider.export import EXPORT_COLUMNS, _get_dictionaries
+from tests.cases import TemporaryCacheClassMixin
+
+
+class TestExport(TemporaryCacheClassMixin):
+    """Test exporting to Parquet and Arrow IPC."""
+
+    manager: Manager
+
+    def setUp(self):
+        """Make a temporary directory for the output."""
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.directory.cleanup()
+
+    def _check_table(self, table):
+        self.assertEqual(EXPORT_COLUMNS, table.column_names)
+        self.assertEqual(20, table.num_rows)
+        for field in table.schema:
+            self.assertEqual('dictionary', str(field.type).split('<')[0], msg=field.name)
+
+        rows = table.to_pydict()
+        self.assertEqual(10, rows['relation'].count('increases'))
+        self.assertEqual(10, rows['relation'].count('decreases'))
+        self.assertEqual({'85'}, set(rows['pubchem_id']))
+        self.assertEqual(10, rows['detection'].count(None))
+
+    def test_parquet(self):
+        """Test writing in small chunks to Parquet."""
+        import pyarrow.parquet as pq
+
+        path = os.path.join(self.directory.name, 'sider.parquet')
+        self.assertEqual(20, self.manager.export_edges(path, chunk_size=3))
+        self._check_table(pq.read_table(path))
+
+    def test_arrow(self):
+        """Test writing in small chunks to an Arrow IPC file, which is also readable as Feather."""
+        import pyarrow as pa
+        import pyarrow.feather
+
+        path = os.path.join(self.directory.name, 'sider.arrow')
+        self.assertEqual(20, self.manager.export_edges(path, chunk_size=3))
+        with pa.OSFile(path) as file:
+            self._check_table(pa.ipc.open_file(file).read_all())
+        self._check_table(pyarrow.feather.read_table(path))
+
+    def test_arrow_stream(self):
+        """Test writing in small chunks to an Arrow IPC stream."""
+        import pyarrow as pa
+
+        path = os.path.join(self.directory.name, 'sider.arrows')
+        self.assertEqual(20, self.manager.export_edges(path, chunk_size=3))
+        with pa.OSFile(path) as file:
+            self._check_table(pa.ipc.open_stream(file).read_all())
+
+    def test_invalid_format(self):
+        """Test a path with an unknown extension is rejected."""
+        with self.assertRaises(ValueError):
+            self.manager.export_edges(os.path.join(self.directory.name, 'sider.csv'))
+
+    def test_unknown_value(self):
+        """Test a value missing from the dictionaries raises an error instead of being written as null."""
+        def get_dictionaries(connection):
+            pubchem_ids, *dictionaries = _get_dictionaries(connection)
+            return [[pubchem_id for pubchem_id in pubchem_ids if pubchem_id != '85'], *dictionaries]
+
+        path = os.path.join(self.directory.name, 'sider.parquet')
+        with mock.patch('bio2bel_sider.export._get_dictionaries', get_dictionaries):
+            with self.assertRaises(ValueError):
+                self.manager.export_edges(path)
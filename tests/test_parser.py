@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for parsing SIDER files."""
+
+import unittest
+
+from bio2bel_sider.manager import FREQUENCY_COLUMNS, INDICATIONS_COLUMNS, SIDE_EFFECTS_COLUMNS
+from bio2bel_sider.parser import get_indications_df, get_se_frequency_df, get_side_effects_df
+from tests.cases import TEST_FREQUENCIES_PATH, TEST_INDICATIONS_PATH, TEST_SIDE_EFFECTS_PATH
+
+
+class TestParser(unittest.TestCase):
+    """Test the typed getters."""
+
+    def test_indications(self):
+        """Test only the requested columns are parsed, with categorical types."""
+        df = get_indications_df(url=TEST_INDICATIONS_PATH, usecols=INDICATIONS_COLUMNS)
+        self.assertEqual(set(INDICATIONS_COLUMNS), set(df.columns))
+        self.assertEqual(10, len(df.index))
+        for column in INDICATIONS_COLUMNS:
+            self.assertEqual('category', df[column].dtype.name, msg=column)
+        self.assertEqual({'NLP_indication', 'text_mention'}, set(df['Method of Detection'].cat.categories))
+
+    def test_side_effects(self):
+        """Test only the requested columns are parsed, with categorical types."""
+        df = get_side_effects_df(url=TEST_SIDE_EFFECTS_PATH, usecols=SIDE_EFFECTS_COLUMNS)
+        self.assertEqual(set(SIDE_EFFECTS_COLUMNS), set(df.columns))
+        self.assertEqual(10, len(df.index))
+        self.assertEqual({'LLT', 'PT'}, set(df['MedDRA Concept Type'].cat.categories))
+
+    def test_side_effects_all_columns(self):
+        """Test all columns are parsed when none are specified."""
+        df = get_side_effects_df(url=TEST_SIDE_EFFECTS_PATH)
+        self.assertEqual(6, len(df.columns))
+        self.assertEqual(1, len(df['STITCH_STEREO_ID'].cat.categories))
+
+    def test_frequencies(self):
+        """Test the frequency bounds are parsed as numbers."""
+        df = get_se_frequency_df(url=TEST_FREQUENCIES_PATH, usecols=FREQUENCY_COLUMNS)
+        self.assertEqual(8, len(df.index))
+        self.assertEqual('float64', df['Frequency lower bound'].dtype.name)
+        self.assertEqual('float64', df['Frequency upper bound'].dtype.name)
+        self.assertEqual(['placebo'], list(df['Type of effect'].cat.categories))
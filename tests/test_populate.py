@@ -13,5 +13,53 @@ class TestPopulate(TemporaryCacheClassMixin):
 
     def test_counts(self):
         """Test the right number of entities were added."""
-        self.assertEqual(4, self.manager.count_indications())
-        self.assertEqual(4, self.manager.count_side_effects())
+        self.assertEqual(10, self.manager.count_indications())
+        self.assertEqual(10, self.manager.count_side_effects())
+        self.assertEqual(8, self.manager.count_frequencies())
+
+    def test_summarize(self):
+        """Test the summary is read from the precomputed statistics."""
+        self.assertEqual(
+            dict(
+                compounds=1,
+                side_effects=10,
+                indications=10,
+                frequencies=8,
+                umls=self.manager.count_umls(),
+                meddra_terms=6,
+            ),
+            self.manager.summarize(),
+        )
+
+    def test_top_compounds(self):
+        """Test the per-compound counts."""
+        compounds = self.manager.get_top_compounds()
+        self.assertEqual(1, len(compounds))
+        self.assertEqual(6, compounds[0].side_effect_count)
+        self.assertEqual(5, compounds[0].indication_count)
+
+    def test_top_side_effects(self):
+        """Test the per-UMLS counts."""
+        side_effects = self.manager.get_top_side_effects(n=3)
+        self.assertEqual(3, len(side_effects))
+        for umls in side_effects:
+            self.assertEqual(1, umls.side_effect_compound_count)
+
+    def test_frequencies(self):
+        """Test range queries over the side effect frequencies."""
+        frequencies = self.manager.get_frequencies(cuis=['C0003123', 'C0002871'], minimum=0.1)
+        self.assertEqual(1, len(frequencies))
+        self.assertEqual('Anorexia', frequencies[0].umls.name)
+        self.assertEqual('12%', frequencies[0].description)
+        self.assertAlmostEqual(0.12, frequencies[0].lower_bound)
+
+        frequencies = self.manager.get_frequencies(cuis=['C0003123'], minimum=0.1, placebo=True)
+        self.assertEqual(1, len(frequencies))
+        self.assertTrue(frequencies[0].placebo)
+
+        frequencies = self.manager.get_frequencies(cuis=['C0003123', 'C0002871'], minimum=0.1, placebo=None)
+        self.assertEqual(2, len(frequencies))
+
+        frequencies = self.manager.get_frequencies(stitch_ids=['CID100000085'], maximum=0.01)
+        self.assertEqual(['Amblyopia'], [frequency.umls.name for frequency in frequencies])
+        self.assertEqual(6, len(self.manager.get_frequencies(stitch_ids=['CID100000085'])))
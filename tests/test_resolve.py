@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for resolving identifiers in bulk."""
+
+import os
+import tempfile
+import unittest
+
+from click.testing import CliRunner
+
+from bio2bel_sider import Manager
+from bio2bel_sider.resolve import normalize_identifiers
+from tests.cases import TemporaryCacheClassMixin
+
+IDENTIFIERS = [
+    'CID100000085',  # STITCH flat
+    'CID000010917',  # STITCH stereo, listed under CID100000085
+    ' 85 ',  # PubChem, with whitespace
+    'pubchem.compound:85',
+    'C0000737',  # UMLS
+    'umls:c0002871',
+    'meddra:10000081',  # MedDRA, maps to C0000737
+    'meddra:10099999',  # MedDRA, maps to a CUI not in SIDER
+    'CID100000001',  # STITCH flat, not in SIDER
+    'CID000000085',  # STITCH stereo, not in SIDER
+    'C9999999',  # UMLS, not in SIDER
+    'not an identifier',
+]
+
+
+class TestNormalize(unittest.TestCase):
+    """Test normalizing identifiers."""
+
+    def test_normalize(self):
+        """Test the namespace and key of each identifier."""
+        df = normalize_identifiers(IDENTIFIERS)
+        self.assertEqual(
+            [
+                ('stitch_flat', '85'),
+                ('stitch_stereo', '10917'),
+                ('pubchem', '85'),
+                ('pubchem', '85'),
+                ('umls', 'C0000737'),
+                ('umls', 'C0002871'),
+                ('meddra', '10000081'),
+                ('meddra', '10099999'),
+                ('stitch_flat', '1'),
+                ('stitch_stereo', '85'),
+                ('umls', 'C9999999'),
+            ],
+            list(zip(df['namespace'], df['key']))[:-1],
+        )
+        self.assertTrue(df['namespace'].isna().iloc[-1])
+
+    def test_leading_zeros(self):
+        """Test leading zeros are stripped from compound identifiers, even ones too long for an integer."""
+        df = normalize_identifiers(['CID:0085', 'pubchem:000', '123456789012345678901234', 'meddra:0010000081'])
+        self.assertEqual(['85', '0', '123456789012345678901234', '0010000081'], df['key'].tolist())
+
+    def test_default_namespace(self):
+        """Test bare numbers are put in the default namespace."""
+        df = normalize_identifiers(['10000081', 'pubchem:85'], default_namespace='meddra')
+        self.assertEqual(['meddra', 'pubchem'], df['namespace'].tolist())
+
+        with self.assertRaises(ValueError):
+            normalize_identifiers(['85'], default_namespace='umls')
+
+
+class TestResolve(TemporaryCacheClassMixin):
+    """Test resolving identifiers against the database."""
+
+    manager: Manager
+
+    def test_resolve(self):
+        """Test resolving identifiers from each namespace, in small chunks."""
+        resolved, unresolved = self.manager.resolve(IDENTIFIERS, chunk_size=2)
+
+        self.assertEqual(IDENTIFIERS[:7], resolved['identifier'].tolist())
+        self.assertEqual(['compound'] * 4 + ['umls'] * 3, resolved['entity'].tolist())
+        self.assertEqual({'CID100000085'}, set(resolved['stitch_id'].iloc[:4]))
+        self.assertEqual({'85'}, set(resolved['pubchem_id'].iloc[:4]))
+        self.assertEqual(['C0000737', 'C0002871', 'C0000737'], resolved['cui'].iloc[4:].tolist())
+        self.assertEqual(['Abdominal pain', 'Anaemia', 'Abdominal pain'], resolved['name'].iloc[4:].tolist())
+
+        self.assertEqual(IDENTIFIERS[7:], unresolved['identifier'].tolist())
+
+    def test_overlong(self):
+        """Test a number too long for an integer doesn't stop the rest of the identifiers from resolving."""
+        resolved, unresolved = self.manager.resolve(['123456789012345678901234', 'CID100000085'])
+        self.assertEqual(['CID100000085'], resolved['identifier'].tolist())
+        self.assertEqual(['123456789012345678901234'], unresolved['identifier'].tolist())
+
+    def test_cli(self):
+        """Test the resolve command writes resolved and unresolved identifiers to separate files."""
+        runner = CliRunner()
+        with tempfile.TemporaryDirectory() as directory:
+            input_path = os.path.join(directory, 'identifiers.txt')
+            with open(input_path, 'w') as file:
+                print(*IDENTIFIERS, sep='\n', file=file)
+
+            output = os.path.join(directory, 'resolved.tsv')
+            result = runner.invoke(
+                Manager.get_cli(),
+                ['-c', self.manager.connection, 'resolve', '-i', input_path, '-o', output],
+            )
+            self.assertEqual(0, result.exit_code, msg=result.output)
+
+            with open(output) as file:
+                self.assertEqual(1 + 7, len(file.readlines()))
+            with open(os.path.join(directory, 'resolved.unresolved.tsv')) as file:
+                self.assertEqual(1 + 5, len(file.readlines()))